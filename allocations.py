@@ -0,0 +1,163 @@
+# Planet Latin - Allocation tracking
+# Takes tracemalloc snapshots when the game changes state (and on demand) and
+# writes a report of what grew between them: the top allocating lines, object
+# counts by type, surviving pygame surfaces and where surfaces were created.
+# Meant for chasing memory creep over long class sessions.
+import gc
+import os
+import time
+import tracemalloc
+from collections import Counter, deque
+
+from config import GameConfig
+from profiler import _PygameSurface, count_surfaces, get_surface_counts
+
+# Our own modules, for the game code section of the report
+_GAME_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _format_size(size, signed=False):
+    """Format a byte count for humans, with a + on growth if signed"""
+    sign = "+" if signed and size > 0 else ""
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024 or unit == "MiB":
+            return f"{sign}{size:.0f} {unit}" if unit == "B" else f"{sign}{size:.1f} {unit}"
+        size /= 1024
+
+
+def _short_path(filename):
+    """Shorten paths inside the game to the file name"""
+    if filename.startswith(_GAME_DIR):
+        return os.path.relpath(filename, _GAME_DIR)
+    return filename
+
+
+class AllocationSnapshot:
+    """Memory state at one moment: traced allocations plus live object counts"""
+    
+    def __init__(self, label, elapsed):
+        self.label = label
+        self.elapsed = elapsed
+        self.traces = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),  # The tracker's own bookkeeping
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<unknown>"),
+        ])
+        self.traced_size = sum(stat.size for stat in self.traces.statistics("filename"))
+        
+        # Live objects by type. Plain surfaces aren't tracked by the
+        # collector, so they are found through whatever refers to them.
+        self.types = Counter()
+        surfaces = {}
+        for obj in gc.get_objects():
+            self.types[type(obj).__name__] += 1
+            for referent in gc.get_referents(obj):
+                if isinstance(referent, _PygameSurface):
+                    surfaces[id(referent)] = referent
+        self.object_count = sum(self.types.values())
+        self.surface_count = len(surfaces)
+        self.surface_bytes = sum(s.get_width() * s.get_height() * s.get_bytesize() for s in surfaces.values())
+        self.surfaces_created, self.surface_sites = get_surface_counts()
+
+
+class AllocationTracker:
+    """Snapshots memory at state transitions and reports the growth between them"""
+    
+    def __init__(self, path, depth=GameConfig.ALLOC_TRACE_DEPTH, top=GameConfig.ALLOC_REPORT_TOP,
+                 kept=GameConfig.ALLOC_SNAPSHOTS_KEPT):
+        self.path = path
+        self.depth = depth
+        self.top = top
+        self.baseline = None
+        self.snapshots = deque(maxlen=kept)  # Most recent, after the baseline
+        self.started_at = None
+    
+    def start(self):
+        """Start tracing and take the baseline snapshot"""
+        tracemalloc.start(self.depth)
+        count_surfaces(True)
+        self.started_at = time.perf_counter()
+        self.baseline = AllocationSnapshot("start", 0.0)
+    
+    def stop(self):
+        """Stop tracing; the snapshots stay available for the report"""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            count_surfaces(False)
+    
+    def snapshot(self, label):
+        """Take a snapshot now"""
+        if self.baseline is None:
+            return
+        self.snapshots.append(AllocationSnapshot(label, time.perf_counter() - self.started_at))
+    
+    def _describe_change(self, lines, before, after):
+        """Report the growth from one snapshot to another"""
+        lines.append(f"Traced memory: {_format_size(after.traced_size)} "
+                     f"({_format_size(after.traced_size - before.traced_size, True)})")
+        lines.append(f"Objects: {after.object_count} ({after.object_count - before.object_count:+d}), "
+                     f"surfaces alive: {after.surface_count} ({after.surface_count - before.surface_count:+d}), "
+                     f"{_format_size(after.surface_bytes)} of pixels "
+                     f"({_format_size(after.surface_bytes - before.surface_bytes, True)})")
+        
+        lines.append("Top allocating lines:")
+        for stat in after.traces.compare_to(before.traces, "lineno")[:self.top]:
+            if stat.size_diff == 0:
+                break
+            frame = stat.traceback[0]
+            lines.append(f"  {_short_path(frame.filename)}:{frame.lineno}: "
+                         f"{_format_size(stat.size_diff, True)} ({stat.count_diff:+d} blocks), "
+                         f"{_format_size(stat.size)} total")
+        
+        growth = Counter(after.types)
+        growth.subtract(before.types)
+        grown = [(name, count) for name, count in growth.most_common(self.top) if count > 0]
+        lines.append("Object growth by type: " + (", ".join(f"{name} +{count}" for name, count in grown) or "none"))
+        
+        created = after.surfaces_created - before.surfaces_created
+        lines.append(f"Surfaces created: {created}")
+        sites = Counter(after.surface_sites)
+        sites.subtract(before.surface_sites)
+        for (filename, lineno, function), count in sites.most_common(self.top):
+            if count <= 0:
+                break
+            lines.append(f"  {_short_path(filename)}:{lineno} in {function}: {count}")
+    
+    def write_report(self, path=None):
+        """Write the report to a text file; returns its path"""
+        path = path or self.path
+        if self.baseline is None:
+            return path
+        snapshots = [self.baseline] + list(self.snapshots)
+        lines = [
+            "Planet Latin allocation report",
+            f"{len(snapshots)} snapshots over {snapshots[-1].elapsed:.1f}s, "
+            f"tracebacks {self.depth} frames deep",
+            "Note: pixel buffers are allocated by SDL, outside tracemalloc; "
+            "they show up under surfaces alive instead.",
+            "",
+        ]
+        for before, after in zip(snapshots, snapshots[1:]):
+            lines.append(f"== {after.label} at {after.elapsed:.1f}s (since {before.label}) ==")
+            self._describe_change(lines, before, after)
+            lines.append("")
+        
+        if len(snapshots) > 2:
+            lines.append(f"== Overall: {snapshots[0].label} to {snapshots[-1].label} ==")
+            self._describe_change(lines, snapshots[0], snapshots[-1])
+            lines.append("")
+        
+        # Memory still held that was allocated by game code, by call stack
+        last = snapshots[-1]
+        game_traces = last.traces.filter_traces([tracemalloc.Filter(True, os.path.join(_GAME_DIR, "*"))])
+        lines.append("== Largest allocations still held by game code ==")
+        for stat in game_traces.statistics("traceback")[:self.top]:
+            lines.append(f"{_format_size(stat.size)} in {stat.count} blocks")
+            for frame in reversed(stat.traceback[-4:]):
+                lines.append(f"    {_short_path(frame.filename)}:{frame.lineno}")
+        
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return path
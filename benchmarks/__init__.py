@@ -0,0 +1,3 @@
+# Planet Latin - Benchmarks
+# Reproducible timings of the game's hot paths; run them all with
+# python -m benchmarks (see suite.py).
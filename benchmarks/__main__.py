@@ -0,0 +1,4 @@
+# Planet Latin - Benchmark runner (python -m benchmarks)
+from benchmarks.suite import main
+
+main()
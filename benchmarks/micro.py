@@ -0,0 +1,103 @@
+# Planet Latin - Microbenchmarks
+# Answer checking, word selection and text wrapping, each timed over a fixed
+# batch of calls.
+import random
+
+import pygame
+from benchmarks.suite import SEED, benchmark
+from config import GameConfig
+from fonts import get_font
+from latin_dictionary import LatinDictionary
+from monster import MonsterManager
+from textbooks import TextbookManager
+from ui_components import TextDisplay
+
+BATCH = 1000  # Calls per timed run
+
+
+def _answer_cases(dictionary, count):
+    """Answers as players type them: right, one typo, another word, or nothing"""
+    rng = random.Random(SEED)
+    words = sorted(dictionary.all_words.items())
+    cases = []
+    for i in range(count):
+        english, latin = rng.choice(words)
+        kind = i % 4
+        if kind == 0:
+            answer = latin
+        elif kind == 1:
+            position = rng.randrange(len(latin))
+            answer = latin[:position] + "x" + latin[position + 1:]
+        elif kind == 2:
+            answer = rng.choice(words)[1]
+        else:
+            answer = ""
+        cases.append((english, answer))
+    return cases
+
+
+@benchmark("micro.check_translation", BATCH)
+def check_translation():
+    dictionary = LatinDictionary(random.Random(SEED))
+    cases = _answer_cases(dictionary, BATCH)
+    
+    def work():
+        for english, answer in cases:
+            dictionary.check_translation(english, answer)
+    return work
+
+
+@benchmark("micro.is_close_match", BATCH)
+def is_close_match():
+    dictionary = LatinDictionary(random.Random(SEED))
+    pairs = [(answer, dictionary.all_words[english]) for english, answer in _answer_cases(dictionary, BATCH)]
+    
+    def work():
+        for answer, correct in pairs:
+            dictionary._is_close_match(answer, correct)
+    return work
+
+
+@benchmark("micro.get_word_by_difficulty", BATCH)
+def get_word_by_difficulty():
+    dictionary = LatinDictionary(random.Random(SEED))
+    difficulties = ["easy", "medium", "hard"] * (BATCH // 3) + ["easy"] * (BATCH % 3)
+    
+    def work():
+        for difficulty in difficulties:
+            dictionary.get_word_by_difficulty(difficulty)
+    return work
+
+
+@benchmark("micro.get_next_word", BATCH)
+def get_next_word():
+    textbooks = TextbookManager()
+    textbooks.set_current_textbook("henle1", 1)
+    manager = MonsterManager(random.Random(SEED), frame_budget_ms=None)
+    manager.set_textbook_mode(textbooks)
+    
+    def work():
+        for _ in range(BATCH):
+            manager.get_next_word()
+    return work
+
+
+@benchmark("micro.text_display_set_text", 200)
+def text_display_set_text():
+    pygame.font.init()
+    # What the book and lesson panels show, alternated so every call re-wraps
+    textbooks = TextbookManager()
+    texts = [book.description for book in textbooks.textbooks.values()]
+    for book in textbooks.textbooks.values():
+        for number in book.get_available_lessons():
+            lesson = book.get_lesson_info(number)
+            texts.append(f"Grammar Focus: {lesson['grammar_focus']}\n\n"
+                         f"Vocabulary Words: {len(lesson['vocabulary'])}\n\n"
+                         "This lesson will test your knowledge of the vocabulary from this chapter.")
+    texts = (texts * (200 // len(texts) + 1))[:200]
+    panel = TextDisplay(520, 150, 350, 250, get_font(GameConfig.FONT_SIZE_SMALL))
+    
+    def work():
+        for text in texts:
+            panel.set_text(text)
+    return work
@@ -0,0 +1,94 @@
+# Planet Latin - Scenario benchmarks
+# Monster AI updates at growing crowd sizes and whole frames drawn under the
+# SDL dummy driver, timed per simulation step or per frame.
+import random
+
+from benchmarks.suite import SEED, benchmark
+from config import GameConfig, GameState
+from game_input import ScriptedInput
+from monster import MonsterManager
+from player import Player
+
+STEPS = GameConfig.SIMULATION_HZ  # One second of game time per timed run
+FRAMES = 60
+
+
+def _monster_update(count):
+    """Register a benchmark of MonsterManager.update with a crowd of monsters"""
+    @benchmark(f"scenario.monster_update_{count}", STEPS)
+    def monster_update():
+        manager = MonsterManager(random.Random(SEED), frame_budget_ms=None)
+        manager.max_monsters = count
+        player = Player(GameConfig.PLAYER_START_X, GameConfig.PLAYER_START_Y)
+        while len(manager.monsters) < count:
+            manager.spawn_monster(player)
+        manager.spawn_timer = float("inf")  # Keep the crowd at its size
+        dt = 1.0 / GameConfig.SIMULATION_HZ
+        
+        def work():
+            for _ in range(STEPS):
+                manager.update(player, dt)
+        return work
+
+
+for _count in (10, 100, 1000):
+    _monster_update(_count)
+
+
+def _new_game(state=GameState.MENU):
+    """Create a game on the dummy display, set up in one of its screens"""
+    from main import PlanetLatinGame
+    
+    game = PlanetLatinGame(input_source=ScriptedInput([]), seed=SEED)
+    # Star twinkle follows the wall clock, so it would land in random frames
+    game.quality.set_level(1)
+    if state != GameState.MENU:
+        game.selected_textbook = "henle1"
+        game.start_lesson()
+        while len(game.monster_manager.monsters) < game.monster_manager.max_monsters:
+            game.monster_manager.spawn_monster(game.player)
+    if state == GameState.WORD_CHALLENGE:
+        monster = game.monster_manager.monsters[0]
+        game.player.x, game.player.y = monster.x, monster.y
+        while game.state != GameState.WORD_CHALLENGE:
+            game.update(1.0 / GameConfig.SIMULATION_HZ)
+    game.draw()
+    return game
+
+
+def _full_frames(game):
+    """Draw the current screen from scratch every frame"""
+    def work():
+        for _ in range(FRAMES):
+            game.renderer.invalidate()
+            game.draw()
+    return work
+
+
+@benchmark("scenario.frame_menu", FRAMES, threshold=0.3)
+def frame_menu():
+    return _full_frames(_new_game())
+
+
+@benchmark("scenario.frame_playing", FRAMES, threshold=0.3)
+def frame_playing():
+    return _full_frames(_new_game(GameState.PLAYING))
+
+
+@benchmark("scenario.frame_challenge", FRAMES, threshold=0.3)
+def frame_challenge():
+    return _full_frames(_new_game(GameState.WORD_CHALLENGE))
+
+
+@benchmark("scenario.frame_playing_dirty", FRAMES, threshold=0.3)
+def frame_playing_dirty():
+    game = _new_game(GameState.PLAYING)
+    steps = GameConfig.SIMULATION_HZ // GameConfig.FPS
+    
+    def work():
+        # What a frame costs while playing: its simulation steps and a dirty-rect redraw
+        for _ in range(FRAMES):
+            for _ in range(steps):
+                game.update(1.0 / GameConfig.SIMULATION_HZ)
+            game.draw()
+    return work
@@ -0,0 +1,88 @@
+# Planet Latin - Startup benchmark
+# Starts the game cold in a fresh interpreter a few times, under -X importtime,
+# and reports where the time to the first menu frame goes: interpreter start,
+# imports (and which ones), game init and drawing the first frame.
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parse_importtime(stderr):
+    """Get the cumulative microseconds of each top-level import from -X importtime output"""
+    imports = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # The header line
+        name = fields[2]
+        if name.strip() and not name[1:].startswith(" "):  # Not nested under another import
+            imports[name.strip()] = int(fields[1])
+    return imports
+
+
+def measure_startup():
+    """Start the game once and return its startup costs, with the top-level imports"""
+    env = dict(os.environ, SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1")
+    with tempfile.TemporaryDirectory() as directory:
+        report_path = os.path.join(directory, "startup.json")
+        started = time.time()
+        process = subprocess.run([sys.executable, "-X", "importtime", "main.py", "--startup-report", report_path],
+                                 cwd=GAME_DIR, env=env, capture_output=True, text=True)
+        if process.returncode != 0 or not os.path.exists(report_path):
+            raise RuntimeError(f"game failed to start:\n{process.stderr[-2000:]}")
+        with open(report_path, "r", encoding="utf-8") as f:
+            startup = json.load(f)
+    
+    startup["to_first_frame_ms"] = (startup.pop("first_frame_time") - started) * 1000
+    startup["interpreter_ms"] = startup["to_first_frame_ms"] - (
+        startup["imports_ms"] + startup["init_ms"] + startup["first_frame_ms"])
+    startup["imports"] = {name: us / 1000 for name, us in parse_importtime(process.stderr).items()}
+    return startup
+
+
+def summarize(runs):
+    """Take the median of every cost over several runs"""
+    summary = {key: statistics.median(run[key] for run in runs) for key in runs[0] if key != "imports"}
+    names = set().union(*(run["imports"] for run in runs))
+    summary["imports"] = {name: statistics.median(run["imports"].get(name, 0.0) for run in runs)
+                          for name in names}
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure Planet Latin's time to the first menu frame")
+    parser.add_argument("--runs", type=int, default=5, help="cold starts to take the median of")
+    parser.add_argument("--top", type=int, default=10, help="top-level imports to list")
+    parser.add_argument("--output", metavar="PATH", help="write the summary to this JSON file")
+    args = parser.parse_args()
+    
+    runs = [measure_startup() for _ in range(args.runs)]
+    summary = summarize(runs)
+    summary["runs"] = args.runs
+    
+    print(f"Median of {args.runs} cold starts (-X importtime inflates imports a little):")
+    for label, key in (("Interpreter start", "interpreter_ms"), ("Imports", "imports_ms"),
+                       ("Game init", "init_ms"), ("First frame", "first_frame_ms"),
+                       ("Time to first frame", "to_first_frame_ms"), ("Assets ready after", "warmup_ms")):
+        print(f"  {label:22}{summary[key]:8.1f}ms")
+    print("Slowest top-level imports:")
+    for name, ms in sorted(summary["imports"].items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:22}{ms:8.1f}ms")
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"Summary written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# Planet Latin - Benchmark suite
+# Registers benchmarks, times them, writes the results as JSON and compares
+# them with a stored baseline. Every benchmark builds its state from a fixed
+# seed before each timed run, so all runs do exactly the same work.
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+
+import pygame
+from config import GameConfig
+
+SEED = 2024  # Seed of every random stream the benchmarks use
+RESULTS_VERSION = 1
+
+BENCHMARKS = []
+
+
+class Benchmark:
+    """A named workload: setup builds fresh state and returns the function to time"""
+    
+    def __init__(self, name, setup, ops, threshold=None):
+        self.name = name
+        self.group = name.split(".")[0]
+        self.setup = setup
+        self.ops = ops  # Operations per timed run; results are per operation
+        self.threshold = threshold  # Allowed slowdown, if noisier than the default
+    
+    def run(self, repeats):
+        """Time the workload several times; returns per-operation times in microseconds"""
+        times = []
+        for _ in range(repeats):
+            work = self.setup()
+            gc.collect()
+            gc.disable()  # Collections would land in whichever run happens to trigger them
+            try:
+                start = time.perf_counter()
+                work()
+                elapsed = time.perf_counter() - start
+            finally:
+                gc.enable()
+            times.append(elapsed * 1e6 / self.ops)
+        return {
+            "group": self.group,
+            "ops": self.ops,
+            "repeats": repeats,
+            "best": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.mean(times),
+            "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        }
+
+
+def benchmark(name, ops, threshold=None):
+    """Register a setup function as a benchmark"""
+    def register(setup):
+        BENCHMARKS.append(Benchmark(name, setup, ops, threshold))
+        return setup
+    return register
+
+
+def load_benchmarks():
+    """Import the modules that register benchmarks"""
+    import benchmarks.micro  # noqa: F401
+    import benchmarks.scenarios  # noqa: F401
+
+
+def get_environment():
+    """Describe the machine the results come from"""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(part) for part in pygame.get_sdl_version()),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_benchmarks(selected, repeats):
+    """Run benchmarks, printing each as it finishes; returns the results document"""
+    results = {}
+    for bench in selected:
+        result = results[bench.name] = bench.run(repeats)
+        print(f"{bench.name:40}{result['best']:12.2f}us  "
+              f"(median {result['median']:.2f}, +-{result['stdev']:.2f})")
+    return {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "unit": "us",
+        "seed": SEED,
+        "environment": get_environment(),
+        "results": results,
+    }
+
+
+def save_results(document, path):
+    """Write a results document to a JSON file"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+
+
+def load_results(path):
+    """Read a results document from a JSON file"""
+    with open(path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+    if document.get("version") != RESULTS_VERSION:
+        raise ValueError(f"{path}: unsupported results version {document.get('version')}")
+    return document
+
+
+def compare(document, baseline, threshold):
+    """Compare fastest times with a baseline; returns the names of benchmarks that regressed"""
+    if baseline["environment"] != document["environment"]:
+        print("Note: the baseline was recorded in a different environment")
+    thresholds = {bench.name: bench.threshold for bench in BENCHMARKS}
+    regressions = []
+    print(f"{'':40}{'baseline':>12}{'current':>12}{'change':>10}")
+    for name, result in document["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:40}{'-':>12}{result['best']:12.2f}{'new':>10}")
+            continue
+        change = (result["best"] - before["best"]) / before["best"]
+        limit = thresholds.get(name) or threshold
+        flag = "  REGRESSION" if change > limit else ""
+        if flag:
+            regressions.append(name)
+        print(f"{name:40}{before['best']:12.2f}{result['best']:12.2f}{change:>+10.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Planet Latin benchmarks")
+    parser.add_argument("names", nargs="*", help="only run benchmarks whose name contains one of these")
+    parser.add_argument("--list", action="store_true", help="list the benchmarks and exit")
+    parser.add_argument("--repeats", type=int, default=GameConfig.BENCHMARK_REPEATS,
+                        help="timed runs per benchmark")
+    parser.add_argument("--output", metavar="PATH", help="write the results to this JSON file")
+    parser.add_argument("--baseline", metavar="PATH", default=GameConfig.BENCHMARK_BASELINE,
+                        help="results to compare against")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="store these results as the baseline instead of comparing")
+    parser.add_argument("--threshold", type=float, default=GameConfig.BENCHMARK_THRESHOLD,
+                        help="slowdown that counts as a regression (0.2 = 20%%)")
+    args = parser.parse_args()
+    
+    load_benchmarks()
+    selected = [bench for bench in BENCHMARKS
+                if not args.names or any(name in bench.name for name in args.names)]
+    if args.list:
+        for bench in selected:
+            print(f"{bench.name:40}{bench.ops:6} ops")
+        return
+    
+    pygame.init()
+    document = run_benchmarks(selected, args.repeats)
+    if args.output:
+        save_results(document, args.output)
+        print(f"Results written to {args.output}")
+    
+    if args.save_baseline:
+        save_results(document, args.baseline)
+        print(f"Baseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        print()
+        regressions = compare(document, load_results(args.baseline), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}")
+            sys.exit(1)
+        print(f"No regressions against {args.baseline}")
+    else:
+        print(f"No baseline at {args.baseline}; store one with --save-baseline")
@@ -6,17 +6,75 @@ class GameConfig:
     SCREEN_HEIGHT = 700
     FPS = 60
     
+    # Background settings
+    STAR_COUNT = 100
+    STAR_TWINKLE = True  # needs NumPy; skipped without it
+    STAR_TWINKLE_HZ = 10  # background updates per second while twinkling
+    
+    # Rendering settings
+    DIRTY_RECT_RENDERING = True  # redraw only the regions that changed
+    DIRTY_FULL_REDRAW_FRACTION = 0.5  # redraw everything once the dirty area covers this much
+    DIRTY_MAX_CLIP_RECTS = 4  # clipped draw passes per frame before the closest dirty regions are joined
+    RENDER_MODE = "native"  # "native", "scaled" (SDL scales on the GPU) or "software"
+    WINDOW_SIZE = None  # window size in software mode; None for the screen size
+    FULLSCREEN = False
+    IDLE_MODE = True  # sleep until input on screens with nothing animating
+    IDLE_GRACE_PERIOD = 0.5  # seconds at full frame rate after the last input
+    IDLE_MAX_WAIT = 1.0  # seconds between frames while idle with no animation at all
+    
+    # Quality governor (drops effects while frames run over budget)
+    QUALITY_GOVERNOR = True
+    QUALITY_FRAME_BUDGET_MS = 1000 / FPS
+    QUALITY_SMOOTHING = 0.1  # weight of the newest frame in the moving average
+    QUALITY_LOWER_AT = 0.9  # fraction of the budget that lowers quality
+    QUALITY_RESTORE_AT = 0.5  # fraction of the budget that restores quality
+    QUALITY_LOWER_DELAY = 0.5  # seconds over budget before dropping an effect
+    QUALITY_RESTORE_DELAY = 3.0  # seconds with headroom before bringing one back
+    QUALITY_BUBBLE_DISTANCE = 250  # word bubbles beyond this are dropped first
+    
+    # Frame profiler overlay (F3 to show, F4 to export)
+    PROFILER_HISTORY = 300  # frames kept for percentiles and the graph
+    PROFILER_PANEL_SIZE = (360, 240)
+    PROFILER_REFRESH_HZ = 4  # overlay redraws per second
+    PROFILER_EXPORT_DIR = "profiles"
+    SAMPLER_INTERVAL = 0.005  # seconds between call stack samples (F5 or --profile)
+    ALLOC_TRACE_DEPTH = 10  # frames kept per traced allocation (--trace-allocations)
+    ALLOC_REPORT_TOP = 15  # entries per section of the allocation report
+    ALLOC_SNAPSHOTS_KEPT = 30  # recent snapshots kept besides the first
+    BENCHMARK_REPEATS = 5  # timed runs per benchmark; the fastest counts
+    BENCHMARK_THRESHOLD = 0.2  # slowdown against the baseline reported as a regression
+    BENCHMARK_BASELINE = "benchmarks/baseline.json"
+    
+    # Simulation settings (fixed timestep, decoupled from rendering)
+    SIMULATION_HZ = 120
+    MAX_FRAME_TIME = 0.25  # seconds of real time simulated per frame at most
+    MAX_SIMULATION_STEPS = 10  # step cap per frame to avoid a spiral of death
+    
     # Player settings
     PLAYER_SPEED = 4
     PLAYER_SIZE = (30, 40)
     PLAYER_START_X = 100
     PLAYER_START_Y = 300
+    PLAYER_FIRST_LEVEL_XP = 100  # experience needed for level 2
+    PLAYER_XP_GROWTH = 1.2  # requirement multiplier per level
+    PLAYER_WALK_FRAMES = 12  # pre-rendered frames per walk cycle
+    PLAYER_GLOW_STEPS = 8  # pre-rendered strengths of each glow effect
+    PLAYER_RING_STEP = 4  # radius step of the pre-rendered level up rings
     
     # Monster settings
     MONSTER_SIZE = (40, 50)
     MONSTER_SPEED = 1.5
     MONSTER_SPAWN_DISTANCE = 200  # Distance from player to spawn
     MAX_MONSTERS = 5
+    MONSTER_SPAWN_INTERVAL = 8.0  # seconds between spawns at the start
+    MONSTER_SPAWN_ACCELERATION = 0.9  # spawn interval multiplier per monster level
+    MONSTER_MIN_SPAWN_INTERVAL = 3.0
+    
+    # Monster AI scheduling (level of detail)
+    AI_NEAR_DISTANCE = 200  # Monsters closer than this update every frame
+    AI_FAR_UPDATE_INTERVAL = 0.1  # seconds between updates for distant monsters
+    AI_FRAME_BUDGET_MS = 2.0  # CPU budget per frame for distant monster updates
+    AI_STATS_HISTORY = 120  # frames of scheduler metrics to keep
     
     # Word challenge settings
     TYPING_TIME_LIMIT = 15  # seconds to type the answer
@@ -28,6 +86,8 @@ class GameConfig:
     FONT_SIZE_LARGE = 36
     FONT_SIZE_MEDIUM = 24
     FONT_SIZE_SMALL = 18
+    FONT_PRELOAD_SIZES = (FONT_SIZE_LARGE, FONT_SIZE_MEDIUM, FONT_SIZE_SMALL)
+    WARMUP_WORKERS = 2  # threads loading textbook data and the dictionary while the main menu is up
     INPUT_BOX_WIDTH = 300
     INPUT_BOX_HEIGHT = 40
 
@@ -0,0 +1,86 @@
+# Planet Latin - Font registry
+# Every (face, size) pair is loaded once and shared by all modules, so no
+# draw call ever has to open a font file.
+import time
+
+import pygame
+from config import GameConfig
+
+
+class CountingFont(pygame.font.Font):
+    """A font that counts the text it renders, for the frame profiler"""
+    
+    renders = 0  # Across all fonts since startup
+    
+    def render(self, *args, **kwargs):
+        CountingFont.renders += 1
+        return super().render(*args, **kwargs)
+
+
+class FontRegistry:
+    """Process-wide cache of loaded fonts, keyed by (face, size)"""
+    
+    def __init__(self):
+        self.fonts = {}
+        self.load_times = {}  # (face, size) -> milliseconds spent loading
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, size, face=None):
+        """Get a font, loading it on first use"""
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is not None:
+            self.hits += 1
+            return font
+        
+        self.misses += 1
+        return self._load(key)
+    
+    def _load(self, key):
+        """Load a font and time it"""
+        start = time.perf_counter()
+        font = CountingFont(*key)
+        self.load_times[key] = (time.perf_counter() - start) * 1000
+        self.fonts[key] = font
+        return font
+    
+    def preload(self, sizes=GameConfig.FONT_PRELOAD_SIZES, face=None):
+        """Load the given sizes now"""
+        for size in sizes:
+            key = (face, size)
+            if key not in self.fonts:
+                self._load(key)
+    
+    def get_stats(self):
+        """Get cache and load-time statistics"""
+        return {
+            "fonts": len(self.fonts),
+            "hits": self.hits,
+            "misses": self.misses,
+            "load_ms": sum(self.load_times.values()),
+            "load_times": {f"{face or 'default'}:{size}": ms
+                           for (face, size), ms in self.load_times.items()},
+        }
+    
+    def report(self):
+        """Describe the registry in one line"""
+        stats = self.get_stats()
+        return (f"{stats['fonts']} fonts loaded in {stats['load_ms']:.1f}ms, "
+                f"{stats['hits']} hits, {stats['misses']} loads on demand")
+
+
+font_registry = FontRegistry()
+
+
+def get_font(size, face=None):
+    """Get a shared font from the process-wide registry"""
+    return font_registry.get(size, face)
+
+
+if __name__ == "__main__":
+    pygame.font.init()
+    font_registry.preload()
+    print(font_registry.report())
+    for name, ms in font_registry.get_stats()["load_times"].items():
+        print(f"  {name}: {ms:.2f}ms")
@@ -0,0 +1,121 @@
+# Input sources for Planet Latin
+import abc
+import pygame
+import json
+from collections import defaultdict
+
+
+class InputSource(abc.ABC):
+    """What the game expects of an input source; subclasses fill in the events and keys"""
+    
+    deterministic = False  # True: skip the wall-clock AI budget so runs repeat exactly
+    events_per_step = False  # True: events are tied to simulation steps, not rendered frames
+    
+    def attach(self, game):
+        """Called by a headless session with the game it drives"""
+        pass
+    
+    def attach_display(self, display):
+        """Called with the game's display when there is a window"""
+        pass
+    
+    @abc.abstractmethod
+    def get_events(self):
+        """Get the input events since the last call"""
+    
+    @abc.abstractmethod
+    def get_pressed(self):
+        """Get the held keys"""
+    
+    def tick(self, sim_time):
+        """Advance to the given simulation time"""
+        pass
+    
+    def finish(self, game):
+        """Called when the game loop ends"""
+        pass
+
+
+class PygameInput(InputSource):
+    """Reads events and held keys straight from pygame"""
+    
+    deterministic = False  # Live input: keep the wall-clock AI budget
+    events_per_step = False  # Events are read once per rendered frame
+    
+    def __init__(self):
+        self.display = None
+    
+    def attach_display(self, display):
+        """Use the display to convert mouse positions to game coordinates"""
+        self.display = display
+    
+    def get_events(self):
+        """Get all pending input events"""
+        events = pygame.event.get()
+        if self.display is not None:
+            for event in events:
+                self.display.map_event(event)
+        return events
+    
+    def get_pressed(self):
+        """Get the currently held keys"""
+        return pygame.key.get_pressed()
+
+
+class ScriptedInput(InputSource):
+    """Plays back a scripted list of timed key events"""
+    
+    deterministic = True
+    events_per_step = True
+    
+    def __init__(self, script):
+        # Script entries: {"time": seconds, "type": "keydown"/"keyup"/"text", "key": name, "text": str}
+        self.script = sorted(script, key=lambda entry: entry["time"])
+        self.next_index = 0
+        self.sim_time = 0.0
+        self.pending_events = []
+        self.held_keys = defaultdict(bool)
+    
+    @classmethod
+    def from_file(cls, path):
+        """Load a script from a JSON file"""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+    
+    def tick(self, sim_time):
+        """Release all scripted events up to the given simulation time"""
+        self.sim_time = sim_time
+        while self.next_index < len(self.script) and self.script[self.next_index]["time"] <= sim_time:
+            self.pending_events.extend(self._to_events(self.script[self.next_index]))
+            self.next_index += 1
+    
+    def is_finished(self):
+        """Check whether every scripted event has been delivered"""
+        return self.next_index >= len(self.script) and not self.pending_events
+    
+    def get_events(self):
+        """Get the events released since the last call"""
+        events = self.pending_events
+        self.pending_events = []
+        return events
+    
+    def get_pressed(self):
+        """Get the keys currently held down by the script"""
+        return self.held_keys
+    
+    def _to_events(self, entry):
+        """Convert one script entry into pygame events"""
+        if entry["type"] == "text":
+            return [make_key_event(pygame.KEYDOWN, ord(ch), ch) for ch in entry["text"]]
+        
+        key = pygame.key.key_code(entry["key"])
+        if entry["type"] == "keydown":
+            self.held_keys[key] = True
+            return [make_key_event(pygame.KEYDOWN, key, entry.get("text", ""))]
+        self.held_keys[key] = False
+        return [make_key_event(pygame.KEYUP, key, "")]
+
+
+def make_key_event(event_type, key, unicode=""):
+    """Build a synthetic keyboard event"""
+    return pygame.event.Event(event_type, key=key, unicode=unicode, mod=0, scancode=0)
@@ -0,0 +1,238 @@
+# Planet Latin - Glyph atlas text renderer
+# Rasterises each character once per font and colour and composes strings by
+# blitting glyphs, for text that changes every frame (timers, counters, typed
+# answers) where caching whole rendered strings doesn't help. It only pays
+# off for glyphs rendered onto a known opaque background: alpha-blended glyph
+# blits measure no faster than font.render (run this module to compare).
+import time
+
+import pygame
+from config import GameConfig, Colors
+from fonts import get_font
+
+# Printable ASCII; anything else is added to the atlas when first drawn
+PRELOAD_CHARACTERS = "".join(chr(code) for code in range(32, 127))
+
+
+class GlyphAtlas:
+    """Every glyph of one font and colour packed on a single surface.
+    
+    Given the colour of what the text is drawn on, glyphs are rendered
+    opaque onto it and blitting them skips alpha blending altogether.
+    """
+    
+    def __init__(self, font, color, background=None, characters=PRELOAD_CHARACTERS):
+        self.font = font
+        self.color = color
+        self.background = background
+        self.height = font.get_height()
+        self.glyphs = {}  # character -> (area in the atlas, advance)
+        self.atlas = None
+        self._build(characters)
+    
+    def _build(self, characters):
+        """Render the characters side by side into a fresh atlas"""
+        rendered = []
+        for ch in characters:
+            glyph = self.font.render(ch, True, self.color, self.background)
+            metrics = self.font.metrics(ch)[0]
+            advance = metrics[4] if metrics else glyph.get_width()
+            rendered.append((ch, glyph, advance))
+        
+        width = sum(glyph.get_width() for _, glyph, _ in rendered)
+        atlas = self._new_surface(max(1, width))
+        glyphs = {}
+        x = 0
+        for ch, glyph, advance in rendered:
+            atlas.blit(glyph, (x, 0))
+            glyphs[ch] = (pygame.Rect(x, 0, glyph.get_width(), glyph.get_height()), advance)
+            x += glyph.get_width()
+        
+        self.atlas = atlas
+        self.glyphs = glyphs
+    
+    def _new_surface(self, width):
+        """Create a surface one line high to compose glyphs on"""
+        if self.background is None:
+            surface = pygame.Surface((width, self.height), pygame.SRCALPHA)
+            surface.fill((0, 0, 0, 0))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+        else:
+            surface = pygame.Surface((width, self.height))
+            surface.fill(self.background)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+        return surface
+    
+    def clear(self, surface, rect):
+        """Blank part of a surface made by _new_surface"""
+        surface.fill(self.background or (0, 0, 0, 0), rect)
+    
+    def _add(self, ch):
+        """Grow the atlas with a character it doesn't have yet"""
+        self._build("".join(self.glyphs) + ch)
+    
+    def size(self, text):
+        """Get the (width, height) the text takes up"""
+        width = 0
+        for ch in text:
+            if ch not in self.glyphs:
+                self._add(ch)
+            width += self.glyphs[ch][1]
+        return width, self.height
+    
+    def draw(self, surface, text, dest):
+        """Draw text with its top-left corner at dest; returns the covered rect"""
+        x, y = dest
+        blits = []
+        for ch in text:
+            glyph = self.glyphs.get(ch)
+            if glyph is None:
+                self._add(ch)
+                glyph = self.glyphs[ch]
+            area, advance = glyph
+            blits.append((self.atlas, (x, y), area))
+            x += advance
+        surface.blits(blits, doreturn=False)
+        return pygame.Rect(dest[0], y, x - dest[0], self.height)
+    
+    def draw_centered(self, surface, text, center):
+        """Draw text centred on a point; returns the covered rect"""
+        width, height = self.size(text)
+        return self.draw(surface, text, (center[0] - width // 2, center[1] - height // 2))
+
+
+class AtlasText:
+    """A line of frequently changing text, recomposed only where it changed.
+    
+    Consecutive values of a timer or counter usually share a prefix
+    ("Time: 12.3s" -> "Time: 12.2s"), so only the glyphs after it are
+    blitted again; an unchanged line costs a single blit.
+    """
+    
+    def __init__(self, atlas, text=""):
+        self.atlas = atlas
+        self.text = None
+        self.positions = []  # x of each character in the line
+        self.width = 0
+        self.surface = None
+        self.set_text(text)
+    
+    def set_text(self, text):
+        """Change the text, recomposing from the first changed character"""
+        if text == self.text:
+            return
+        old = self.text or ""
+        start = 0
+        while start < len(old) and start < len(text) and old[start] == text[start]:
+            start += 1
+        # Redraw the previous glyph too in case it overhangs into the change
+        start = max(0, start - 1)
+        
+        atlas = self.atlas
+        positions = self.positions[:start]
+        x = positions[-1] + atlas.glyphs[text[start - 1]][1] if start else 0
+        blits = []
+        for ch in text[start:]:
+            glyph = atlas.glyphs.get(ch)
+            if glyph is None:
+                atlas._add(ch)
+                glyph = atlas.glyphs[ch]
+            area, advance = glyph
+            positions.append(x)
+            blits.append((atlas.atlas, (x, 0), area))
+            x += advance
+        
+        # Grow the line surface geometrically when the text outgrows it
+        if self.surface is None or x + atlas.height > self.surface.get_width():
+            self.surface = atlas._new_surface(max(64, int((x + atlas.height) * 1.5)))
+            blits = [(atlas.atlas, (px, 0), atlas.glyphs[ch][0]) for px, ch in zip(positions, text)]
+            start = 0
+        clear_x = positions[start] if start < len(positions) else x
+        atlas.clear(self.surface, (clear_x, 0, self.surface.get_width() - clear_x, atlas.height))
+        self.surface.blits(blits, doreturn=False)
+        
+        self.text = text
+        self.positions = positions
+        self.width = x
+    
+    def get_size(self):
+        """Get the (width, height) of the current text"""
+        return self.width, self.atlas.height
+    
+    def draw(self, surface, dest):
+        """Draw the line with its top-left corner at dest; returns the covered rect"""
+        area = pygame.Rect(0, 0, self.width, self.atlas.height)
+        surface.blit(self.surface, dest, area)
+        return pygame.Rect(dest, area.size)
+    
+    def draw_centered(self, surface, center):
+        """Draw the line centred on a point; returns the covered rect"""
+        return self.draw(surface, (center[0] - self.width // 2, center[1] - self.atlas.height // 2))
+
+
+_atlases = {}
+
+
+def get_atlas(font, color, background=None):
+    """Get the shared atlas for a font and colours, building it on first use"""
+    key = (font, tuple(color), background and tuple(background))
+    atlas = _atlases.get(key)
+    if atlas is None:
+        atlas = _atlases[key] = GlyphAtlas(font, color, background)
+    return atlas
+
+
+def _best_time(draw_frames, repeats=5):
+    """Fastest of several timed runs, in seconds"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        draw_frames()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(frames=3000):
+    """Compare per-frame font.render against atlas text on changing HUD lines"""
+    pygame.init()
+    screen = pygame.display.set_mode((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
+    font = get_font(GameConfig.FONT_SIZE_MEDIUM)
+    # What the HUD shows frame by frame at 60 FPS
+    sequences = {
+        "timer": [f"Time: {15 - i / 60:.1f}s" for i in range(frames)],
+        "counter": [f"XP: {i // 20 % 240}/240" for i in range(frames)],
+        "typing": ["agricola"[:(i // 15) % 9] for i in range(frames)],
+    }
+    
+    start = time.perf_counter()
+    atlases = {
+        "AtlasText": get_atlas(font, Colors.TEXT_WHITE),
+        "AtlasText, opaque": get_atlas(font, Colors.TEXT_WHITE, Colors.UI_BACKGROUND),
+    }
+    print(f"Atlases built in {(time.perf_counter() - start) * 1000:.1f}ms")
+    
+    for name, texts in sequences.items():
+        def render_frames():
+            for text in texts:
+                screen.blit(font.render(text, True, Colors.TEXT_WHITE), (10, 10))
+        
+        render_time = _best_time(render_frames)
+        per_frame = 1e6 / len(texts)
+        results = [f"font.render {render_time * per_frame:5.1f}us"]
+        for label, atlas in atlases.items():
+            line = AtlasText(atlas)
+            
+            def atlas_frames():
+                for text in texts:
+                    line.set_text(text)
+                    line.draw(screen, (10, 10))
+            
+            atlas_time = _best_time(atlas_frames)
+            results.append(f"{label} {atlas_time * per_frame:5.1f}us ({render_time / atlas_time:.1f}x)")
+        print(f"{name:8} " + ", ".join(results))
+
+
+if __name__ == "__main__":
+    benchmark()
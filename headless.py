@@ -0,0 +1,238 @@
+# Planet Latin - Headless simulation mode
+# Runs the game logic without a window, as fast as possible, for benchmarks
+# and batch runs on machines with no display.
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse
+import json
+import sys
+import time
+from collections import defaultdict
+
+import pygame
+from config import GameConfig, GameState
+from player import Player
+from main import PlanetLatinGame
+from game_input import InputSource, ScriptedInput, make_key_event
+from sampler import StackSampler
+
+
+class BotPlayer(InputSource):
+    """Stand-in student: walks up to monsters and types answers"""
+    
+    deterministic = True
+    events_per_step = True  # Decides what to press on every simulation step
+    
+    def __init__(self, accuracy=0.8, chars_per_second=4.0, reaction_time=1.0, rng=None):
+        self.accuracy = accuracy  # chance of knowing the right answer
+        self.chars_per_second = chars_per_second
+        self.reaction_time = reaction_time  # seconds before typing starts
+        self.rng = rng  # Defaults to the game's "bot" stream on attach
+        self.game = None
+        self.sim_time = 0.0
+        self.held_keys = defaultdict(bool)
+        self.pending_events = []
+        self.challenge = None
+        self.typing_plan = []  # (time, event) pairs still to be sent
+    
+    def attach(self, game):
+        """Attach the bot to the game it plays"""
+        self.game = game
+        if self.rng is None:
+            self.rng = game.rng.stream("bot")
+    
+    def tick(self, sim_time):
+        """Decide what to press for the coming simulation step"""
+        self.sim_time = sim_time
+        if self.game.state == GameState.PLAYING:
+            self.challenge = None
+            self._steer_towards_nearest_monster()
+        elif self.game.state == GameState.WORD_CHALLENGE:
+            self.held_keys.clear()
+            if self.game.current_challenge is not self.challenge:
+                self.challenge = self.game.current_challenge
+                self._plan_answer()
+            while self.typing_plan and self.typing_plan[0][0] <= sim_time:
+                self.pending_events.append(self.typing_plan.pop(0)[1])
+    
+    def get_events(self):
+        """Get the key events generated since the last call"""
+        events = self.pending_events
+        self.pending_events = []
+        return events
+    
+    def get_pressed(self):
+        """Get the movement keys the bot is holding"""
+        return self.held_keys
+    
+    def _steer_towards_nearest_monster(self):
+        """Hold the arrow keys that lead to the closest monster"""
+        self.held_keys.clear()
+        player = self.game.player
+        # Monsters that already challenged the player never do so again
+        monsters = [m for m in self.game.monster_manager.get_active_monsters()
+                    if not m.is_challenging]
+        if not monsters:
+            return
+        
+        target = min(monsters, key=lambda m: m.distance_squared_to(player))
+        dx = target.x - player.x
+        dy = target.y - player.y
+        self.held_keys[pygame.K_RIGHT] = dx > 2
+        self.held_keys[pygame.K_LEFT] = dx < -2
+        self.held_keys[pygame.K_DOWN] = dy > 2
+        self.held_keys[pygame.K_UP] = dy < -2
+    
+    def _plan_answer(self):
+        """Schedule the keystrokes for the current challenge"""
+        self.typing_plan = []
+        latin_word = self.challenge.monster.latin_word or ""
+        if self.rng.random() < self.accuracy:
+            answer = latin_word.lower()
+        else:
+            # Far enough from the real word to fail the typo tolerance
+            answer = "x" * (len(latin_word) + 3)
+        
+        t = self.sim_time + self.reaction_time * self.rng.uniform(0.5, 1.5)
+        for ch in answer:
+            t += self.rng.expovariate(self.chars_per_second)
+            self.typing_plan.append((t, make_key_event(pygame.KEYDOWN, ord(ch), ch)))
+        t += self.rng.expovariate(self.chars_per_second)
+        self.typing_plan.append((t, make_key_event(pygame.KEYDOWN, pygame.K_RETURN, "\r")))
+
+
+def start_session(game, textbook_id=None, lesson=1):
+    """Jump straight into gameplay, skipping the menus"""
+    if textbook_id:
+        game.selected_textbook = textbook_id
+        game.selected_lesson = lesson
+        game.start_lesson()
+    else:
+        # Free play on the built-in dictionary
+        game.monster_manager = game.create_monster_manager()
+        game.player = Player(GameConfig.PLAYER_START_X, GameConfig.PLAYER_START_Y)
+        game.current_challenge = None
+        game.state = GameState.PLAYING
+
+
+class HeadlessSession:
+    """One game session driven by bot or scripted input, without rendering"""
+    
+    def __init__(self, input_source=None, textbook_id=None, lesson=1, seed=None, skip_menus=True):
+        self.input = input_source or BotPlayer()
+        self.game = PlanetLatinGame(headless=True, input_source=self.input, seed=seed)
+        self.input.attach(self.game)
+        if skip_menus:
+            start_session(self.game, textbook_id, lesson)
+        
+        self.step = 1.0 / GameConfig.SIMULATION_HZ
+        self.steps = 0
+        self.sim_time = 0.0
+        self.wall_time = 0.0
+        self.level_times = {1: 0.0}  # player level -> simulation time reached
+        self.backlog_samples = []  # active monsters, sampled once per second
+    
+    def run_step(self):
+        """Advance the session by one fixed simulation step"""
+        self.input.tick(self.sim_time)
+        self.game.handle_events()
+        self.game.update(self.step)
+        self.steps += 1
+        self.sim_time = self.steps * self.step
+        
+        level = self.game.player.level
+        if level not in self.level_times:
+            self.level_times[level] = self.sim_time
+        if self.steps % GameConfig.SIMULATION_HZ == 0:
+            self.backlog_samples.append(len(self.game.monster_manager.get_active_monsters()))
+    
+    def run(self, seconds=300.0, target_level=None):
+        """Simulate up to the given game time or until the target level"""
+        max_steps = int(seconds * GameConfig.SIMULATION_HZ)
+        start = time.perf_counter()
+        while self.game.running and self.steps < max_steps:
+            self.run_step()
+            if target_level and self.game.player.level >= target_level:
+                break
+        self.wall_time += time.perf_counter() - start
+        return self.get_results()
+    
+    def get_results(self):
+        """Get a summary of the session"""
+        player = self.game.player
+        failures = player.total_attempts - player.correct_attempts
+        return {
+            "seed": self.game.seed,
+            "steps": self.steps,
+            "sim_time": self.sim_time,
+            "level": player.level,
+            "level_times": dict(self.level_times),
+            "words_learned": player.words_learned,
+            "attempts": player.total_attempts,
+            "failures": failures,
+            "failure_rate": failures / player.total_attempts if player.total_attempts else 0.0,
+            "max_backlog": max(self.backlog_samples, default=0),
+            "mean_backlog": sum(self.backlog_samples) / len(self.backlog_samples) if self.backlog_samples else 0.0,
+            "wall_time": self.wall_time,
+            "steps_per_second": self.steps / self.wall_time if self.wall_time else 0.0,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Planet Latin without a display")
+    parser.add_argument("--sessions", type=int, default=1, help="number of sessions to run")
+    parser.add_argument("--seconds", type=float, default=300.0, help="game time per session")
+    parser.add_argument("--target-level", type=int, default=None, help="stop a session at this player level")
+    parser.add_argument("--textbook", default=None, help="textbook id (default: built-in dictionary)")
+    parser.add_argument("--lesson", type=int, default=1, help="lesson number")
+    parser.add_argument("--accuracy", type=float, default=0.8, help="bot answer accuracy")
+    parser.add_argument("--cps", type=float, default=4.0, help="bot typing speed in characters per second")
+    parser.add_argument("--script", default=None, help="JSON input script to play instead of the bot")
+    parser.add_argument("--seed", type=int, default=None, help="seed of the first session (others count up)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="sample the sessions' call stacks and write them here "
+                             "(.json: speedscope, otherwise collapsed stacks)")
+    args = parser.parse_args()
+    
+    sampler = StackSampler() if args.profile else None
+    if sampler:
+        sampler.start()
+    results = []
+    for i in range(args.sessions):
+        if args.script:
+            input_source = ScriptedInput.from_file(args.script)
+        else:
+            input_source = BotPlayer(args.accuracy, args.cps)
+        seed = args.seed + i if args.seed is not None else None
+        session = HeadlessSession(input_source, args.textbook, args.lesson, seed)
+        results.append(session.run(args.seconds, args.target_level))
+    if sampler:
+        sampler.stop()
+        sampler.write(args.profile)
+    
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for i, result in enumerate(results):
+            print(f"Session {i + 1} (seed {result['seed']}): level {result['level']}, "
+                  f"{result['words_learned']} words, "
+                  f"failure rate {result['failure_rate']:.0%}, "
+                  f"{result['steps_per_second']:.0f} steps/s")
+    
+    # Summaries go to stderr with --json, so stdout stays a single JSON document
+    summary = sys.stderr if args.json else sys.stdout
+    total_steps = sum(r["steps"] for r in results)
+    total_wall = sum(r["wall_time"] for r in results)
+    if total_wall > 0:
+        print(f"Throughput: {total_steps / total_wall:.0f} steps/s "
+              f"({total_steps} steps in {total_wall:.2f}s)", file=summary)
+    if sampler:
+        print(f"Sampled {sampler.report()}, written to {args.profile}", file=summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,9 @@
 import random
 
 class LatinDictionary:
-    def __init__(self):
+    def __init__(self, rng=None):
+        self.rng = rng or random  # Injectable for reproducible sessions
+        
         # Comprehensive English-to-Latin word database
         # Organized by difficulty level
         
@@ -155,7 +157,7 @@ class LatinDictionary:
             available_words = word_dict
         
         # Select random word
-        english_word = random.choice(list(available_words.keys()))
+        english_word = self.rng.choice(list(available_words.keys()))
         latin_word = available_words[english_word]
         
         # Mark as used
@@ -165,7 +167,7 @@ class LatinDictionary:
     
     def get_random_word(self):
         """Get a completely random word from any difficulty"""
-        english_word = random.choice(list(self.all_words.keys()))
+        english_word = self.rng.choice(list(self.all_words.keys()))
         latin_word = self.all_words[english_word]
         return english_word, latin_word
     
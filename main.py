@@ -1,19 +1,42 @@
+import time
+_imports_started = time.perf_counter()  # For the startup report
+
 import pygame
 import sys
-import time
+import argparse
+import json
+import math
 from config import GameConfig, Colors, GameState
-from player import Player
+from player import Player, get_player_warmup_steps
 from monster import MonsterManager
 from latin_dictionary import LatinDictionary
 from textbooks import TextbookManager
-from ui_components import Button, ScrollableList, TextDisplay, MenuManager
+from ui_components import Button, ScrollableList, TextDisplay, MenuManager, Label
+from game_input import PygameInput
+from rng import SessionRNG
+from replay import InputRecorder, ReplayInput, load_recording
+from rendering import Display, DirtyRectRenderer
+from fonts import font_registry, get_font
+from glyph_atlas import AtlasText, get_atlas
+from quality import quality_governor
+from profiler import FrameProfiler
+from sampler import StackSampler
+from allocations import AllocationTracker
+from warmup import AssetWarmup
+
+try:
+    import numpy
+except ImportError:  # Twinkling stars are optional
+    numpy = None
+
+_imports_finished = time.perf_counter()
 
 class WordChallenge:
-    def __init__(self, monster):
+    def __init__(self, monster, time_limit=GameConfig.TYPING_TIME_LIMIT):
         self.monster = monster
         self.english_word = monster.get_challenge_word()
         self.user_input = ""
-        self.time_left = GameConfig.TYPING_TIME_LIMIT
+        self.time_left = time_limit
         self.result = None
         self.feedback_message = ""
         self.show_hint = False
@@ -51,30 +74,75 @@ class WordChallenge:
 
 
 class PlanetLatinGame:
-    def __init__(self):
+    # Screens that only change in response to input (besides the sky)
+    IDLE_STATES = [GameState.MENU, GameState.BOOK_SELECTION, GameState.LESSON_SELECTION,
+                   GameState.INSTRUCTIONS, GameState.PAUSED, GameState.GAME_OVER, GameState.VICTORY]
+    
+    def __init__(self, headless=False, input_source=None, seed=None, render_mode=GameConfig.RENDER_MODE,
+                 window_size=GameConfig.WINDOW_SIZE, fullscreen=GameConfig.FULLSCREEN):
+        init_started = time.perf_counter()
         pygame.init()
-        self.screen = pygame.display.set_mode((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
-        pygame.display.set_caption("Planet Latin - Educational Adventure")
+        self.headless = headless
+        
+        # Every random decision derives from this seed; include it in bug reports
+        self.rng = SessionRNG(seed)
+        self.seed = self.rng.seed
+        
+        self.renderer = None
+        if headless:
+            # Logic only: no window is opened and draw() must not be called
+            self.display = None
+            self.screen = None
+        else:
+            # Everything is drawn at the logical screen size; the display
+            # presents it at the window's size
+            self.display = Display(render_mode, window_size, fullscreen)
+            self.screen = self.display.surface
+            pygame.display.set_caption("Planet Latin - Educational Adventure")
+            if GameConfig.DIRTY_RECT_RENDERING:
+                self.renderer = DirtyRectRenderer(self.screen, display=self.display)
         self.clock = pygame.time.Clock()
+        self.input = input_source or PygameInput()
+        if self.display is not None:
+            self.input.attach_display(self.display)
+        # Headless, recorded and replayed runs skip the wall-clock AI budget
+        # so they play out bit for bit the same
+        self.deterministic = headless or self.input.deterministic
+        # Replays measure frame times, so they always run at full quality
+        self.quality = quality_governor
+        self.quality.reset()
+        self.quality.adaptive = GameConfig.QUALITY_GOVERNOR and not self.input.events_per_step
+        self.profiler = FrameProfiler()
+        self.sampler = None  # StackSampler while sampling (F5 or --profile)
+        self.profile_path = None  # Where --profile writes the samples
+        self.allocations = None  # AllocationTracker with --trace-allocations
+        self.warmup = AssetWarmup()  # Started once the first frame is shown (see prewarm)
         
         # Game state
         self.state = GameState.MENU
         self.running = True
         self.dt = 0
+        self.sim_steps = 0  # Fixed simulation steps run so far
+        self.frame_times = None  # Set to a list to capture frame times (ms)
+        self.typing_time_limit = GameConfig.TYPING_TIME_LIMIT
         
         # Game objects
         self.player = Player(GameConfig.PLAYER_START_X, GameConfig.PLAYER_START_Y)
-        self.monster_manager = MonsterManager()
-        self.dictionary = LatinDictionary()
-        self.textbook_manager = TextbookManager()
+        self.monster_manager = self.create_monster_manager()
+        self.textbook_manager = None  # Built when the book list is first shown
         
         # Fonts (initialize before UI)
-        self.font_large = pygame.font.Font(None, GameConfig.FONT_SIZE_LARGE)
-        self.font_medium = pygame.font.Font(None, GameConfig.FONT_SIZE_MEDIUM)
-        self.font_small = pygame.font.Font(None, GameConfig.FONT_SIZE_SMALL)
+        self.font_large = get_font(GameConfig.FONT_SIZE_LARGE)
+        self.font_medium = get_font(GameConfig.FONT_SIZE_MEDIUM)
+        self.font_small = get_font(GameConfig.FONT_SIZE_SMALL)
+        
+        # Challenge text that changes every frame (see _create_challenge_lines)
+        self.input_line = None
+        self.timer_lines = None
         
         # UI Management
-        self.menu_manager = MenuManager()
+        self.menus = {}  # Menu screens, kept once built (see _use_menu)
+        self.menu_manager = None
         self.setup_main_menu()
         
         # Word challenge
@@ -83,28 +151,131 @@ class PlanetLatinGame:
         
         # Background
         self.background_stars = self._generate_stars()
+        self.background = None  # Pre-rendered sky, built on first draw
+        self.overlay = None  # Dimmed snapshot behind the pause and challenge screens
+        self.star_rects = [pygame.Rect(x - size - 1, y - size - 1, size * 2 + 3, size * 2 + 3)
+                           for x, y, brightness, size in self.background_stars]
+        self.star_pixels = None  # (xs, ys, star index) of every star pixel
+        self.star_phases = None
+        self.last_twinkle = 0
         
         # Selection state
         self.selected_textbook = None
         self.selected_lesson = 1
+        
+        # Startup costs in milliseconds; the first frame and warm-up are added by run()
+        self.startup = {
+            "imports_ms": (_imports_finished - _imports_started) * 1000,
+            "init_ms": (time.perf_counter() - init_started) * 1000,
+        }
+        self.init_finished = time.perf_counter()
+        self.first_frame_shown = False
+        self.startup_report_path = None  # --startup-report: write the costs here and quit
+    
+    @property
+    def state(self):
+        return self._state
+    
+    @state.setter
+    def state(self, new_state):
+        old_state = getattr(self, "_state", None)
+        self._state = new_state
+        if new_state != old_state:
+            self._on_state_changed(old_state, new_state)
+    
+    def _on_state_changed(self, old_state, new_state):
+        """React to a game state transition"""
+        # A new screen shares nothing with the old one
+        if self.renderer is not None:
+            self.renderer.invalidate()
+        # Overlay screens capture the game as it was when they opened
+        self.overlay = None
+        # Give the new screen a moment at full rate before idling
+        self.last_input_time = time.perf_counter()
+        if self.allocations is not None:
+            self.allocations.snapshot(f"{old_state} -> {new_state}")
     
     def _generate_stars(self):
         """Generate background stars for Planet Latin atmosphere"""
-        import random
+        rng = self.rng.stream("stars")
         stars = []
-        for _ in range(100):
-            x = random.randint(0, GameConfig.SCREEN_WIDTH)
-            y = random.randint(0, GameConfig.SCREEN_HEIGHT // 2)  # Upper half only
-            brightness = random.randint(100, 255)
-            size = random.randint(1, 2)
+        for _ in range(GameConfig.STAR_COUNT):
+            x = rng.randint(0, GameConfig.SCREEN_WIDTH)
+            y = rng.randint(0, GameConfig.SCREEN_HEIGHT // 2)  # Upper half only
+            brightness = rng.randint(100, 255)
+            size = rng.randint(1, 2)
             stars.append((x, y, brightness, size))
         return stars
     
+    def _build_background(self):
+        """Pre-render the sky and stars into one surface"""
+        self.background = pygame.Surface(self.screen.get_size()).convert()
+        self.background.fill(Colors.BACKGROUND)
+        for x, y, brightness, size in self.background_stars:
+            pygame.draw.circle(self.background, (brightness, brightness, brightness), (x, y), size)
+        
+        self.star_pixels = None
+        if GameConfig.STAR_TWINKLE and numpy is not None:
+            self._index_star_pixels()
+        if self.renderer is not None:
+            self.renderer.invalidate()
+    
+    def _index_star_pixels(self):
+        """Find the pixels each star covers so twinkling can recolour them in bulk"""
+        xs, ys, owners = [], [], []
+        width, height = self.background.get_size()
+        for index, (x, y, brightness, size) in enumerate(self.background_stars):
+            # Draw the star alone on a scratch surface to see which pixels it touches
+            scratch = pygame.Surface((size * 2 + 3, size * 2 + 3))
+            pygame.draw.circle(scratch, Colors.WHITE, (size + 1, size + 1), size)
+            mask = pygame.surfarray.array_red(scratch) > 0
+            local_x, local_y = numpy.nonzero(mask)
+            px = local_x + x - size - 1
+            py = local_y + y - size - 1
+            inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+            xs.append(px[inside])
+            ys.append(py[inside])
+            owners.append(numpy.full(inside.sum(), index))
+        
+        self.star_pixels = (numpy.concatenate(xs), numpy.concatenate(ys), numpy.concatenate(owners))
+        self.star_base_brightness = numpy.array([star[2] for star in self.background_stars], dtype=numpy.float32)
+        rng = self.rng.stream("twinkle")
+        self.star_phases = numpy.array([rng.uniform(0, 2 * math.pi) for _ in self.background_stars], dtype=numpy.float32)
+        self.star_speeds = numpy.array([rng.uniform(1.0, 3.0) for _ in self.background_stars], dtype=numpy.float32)
+    
+    def _update_twinkle(self):
+        """Recolour the star pixels of the background; returns True if it changed"""
+        if self.star_pixels is None:
+            return False
+        now = pygame.time.get_ticks()
+        if now - self.last_twinkle < 1000 / GameConfig.STAR_TWINKLE_HZ:
+            return False
+        self.last_twinkle = now
+        
+        t = now / 1000.0
+        brightness = self.star_base_brightness * (0.75 + 0.25 * numpy.sin(t * self.star_speeds + self.star_phases))
+        xs, ys, owners = self.star_pixels
+        pixels = pygame.surfarray.pixels3d(self.background)
+        pixels[xs, ys] = brightness.astype(numpy.uint8)[owners, None]
+        del pixels  # Unlock the surface
+        return True
+    
+    def get_textbook_manager(self):
+        """Get the textbook data, loading it on first use"""
+        if self.textbook_manager is None:
+            self.textbook_manager = self.warmup.result("textbooks") or TextbookManager()
+        return self.textbook_manager
+    
+    def create_monster_manager(self):
+        """Create a monster manager wired to this session's random stream"""
+        budget = None if self.deterministic else GameConfig.AI_FRAME_BUDGET_MS
+        # The first lesson gets the dictionary built during warm-up
+        return MonsterManager(self.rng.stream("monsters"), budget, self.warmup.result("dictionary"))
+    
     def setup_main_menu(self):
         """Setup the main menu UI"""
-        self.menu_manager.clear()
-        
-        # Title and subtitle are drawn separately
+        if self._use_menu(GameState.MENU):
+            return
         
         # Menu buttons
         button_width = 300
@@ -129,15 +300,31 @@ class PlanetLatinGame:
                            "Exit", self.font_medium,
                            Colors.HARD_LEVEL, Colors.TEXT_BLACK)
         self.menu_manager.add_component(exit_button)
+        
+        # Title with a glow, subtitle and game description
+        center_x = GameConfig.SCREEN_WIDTH // 2
+        self.menu_manager.add_component(Label("PLANET LATIN", self.font_large, Colors.TEXT_WHITE,
+                                              (center_x, 150), Colors.GOLD))
+        self.menu_manager.add_component(Label("Educational Latin Adventure", self.font_medium,
+                                              Colors.TEXT_WHITE, (center_x, 200)))
+        description = [
+            "Choose your textbook and lesson to start learning!",
+            "Defeat monsters by translating English to Latin",
+            "Perfect companion for Latin students"
+        ]
+        for i, line in enumerate(description):
+            self.menu_manager.add_component(Label(line, self.font_small, Colors.LIGHT_GRAY,
+                                                  (center_x, 500 + i * 25)))
     
     def setup_book_selection_menu(self):
         """Setup the book selection UI"""
-        self.menu_manager.clear()
+        if self._use_menu(GameState.BOOK_SELECTION):
+            return
         
         # Title is drawn separately
         
         # Book list
-        textbooks = self.textbook_manager.get_all_textbooks()
+        textbooks = self.get_textbook_manager().get_all_textbooks()
         book_items = []
         for book_id, textbook in textbooks.items():
             book_items.append({
@@ -170,15 +357,28 @@ class PlanetLatinGame:
                            "Back", self.font_medium,
                            Colors.HARD_LEVEL, Colors.TEXT_BLACK)
         self.menu_manager.add_component(back_button)
+        
+        # Title and subtitle
+        center_x = GameConfig.SCREEN_WIDTH // 2
+        self.menu_manager.add_component(Label("SELECT TEXTBOOK", self.font_large, Colors.TEXT_WHITE, (center_x, 80)))
+        self.menu_manager.add_component(Label("Choose your Latin textbook", self.font_medium,
+                                              Colors.LIGHT_GRAY, (center_x, 120)))
     
     def setup_lesson_selection_menu(self):
         """Setup the lesson selection UI"""
-        self.menu_manager.clear()
-        
         if not self.selected_textbook:
+            self.menu_manager = MenuManager()
+            return
+        
+        # One lesson screen per textbook
+        if self._use_menu((GameState.LESSON_SELECTION, self.selected_textbook)):
+            # Keep the selected lesson in step with the list shown
+            selected_lesson = self.menu_manager.components[0].get_selected_item()
+            if selected_lesson:
+                self.selected_lesson = selected_lesson['number']
             return
         
-        textbook = self.textbook_manager.get_textbook(self.selected_textbook)
+        textbook = self.get_textbook_manager().get_textbook(self.selected_textbook)
         available_lessons = textbook.get_available_lessons()
         
         # Create lesson items
@@ -217,12 +417,58 @@ class PlanetLatinGame:
                             "Back", self.font_medium,
                            Colors.HARD_LEVEL, Colors.TEXT_BLACK)
         self.menu_manager.add_component(back_button)
+        
+        # Title and subtitle
+        center_x = GameConfig.SCREEN_WIDTH // 2
+        self.menu_manager.add_component(Label(textbook.name.upper(), self.font_large, Colors.TEXT_WHITE, (center_x, 80)))
+        self.menu_manager.add_component(Label("Choose your lesson", self.font_medium,
+                                              Colors.LIGHT_GRAY, (center_x, 120)))
+    
+    def _use_menu(self, key):
+        """Switch to a cached menu screen; returns False if it still has to be built"""
+        menu = self.menus.get(key)
+        if menu is None:
+            self.menu_manager = self.menus[key] = MenuManager()
+            return False
+        self.menu_manager = menu
+        menu.activate()
+        return True
     
     def handle_events(self):
         """Handle all game events"""
-        for event in pygame.event.get():
+        events = self.input.get_events()
+        if events:
+            self.last_input_time = time.perf_counter()
+        for event in events:
+            # Profiler hotkeys work on every screen
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                self.profiler.toggle()
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+                paths = self.profiler.export_snapshot()
+                print(f"Frame profile written to {', '.join(paths)}")
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F5:
+                if self.sampler is None:
+                    self.start_sampling()
+                else:
+                    self.stop_sampling()
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F6 and self.allocations is not None:
+                self.allocations.snapshot(f"manual ({self.state})")
+                print(f"Allocation report written to {self.allocations.write_report()}")
+                continue
+            
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.VIDEORESIZE:
+                self.display.handle_resize()
+                self.screen = self.display.surface
+                self.background = None  # Rebuilt at the new size on next draw
+                self.overlay = None
+                if self.renderer is not None:
+                    self.renderer.screen = self.screen
+                    self.renderer.invalidate()
             
             # Handle UI events first
             if self.state in [GameState.MENU, GameState.BOOK_SELECTION, GameState.LESSON_SELECTION]:
@@ -266,18 +512,26 @@ class PlanetLatinGame:
                     elif event.key == pygame.K_m:
                         self.state = GameState.MENU
     
-    def update(self):
-        """Update game logic"""
-        self.dt = self.clock.get_time() / 1000.0
+    def update(self, dt):
+        """Advance game logic by one fixed simulation step"""
+        self.dt = dt
+        
+        # Keep the pre-step positions so drawing can interpolate
+        self.player.save_previous_position()
+        self.monster_manager.save_previous_positions()
         
         if self.state == GameState.PLAYING:
             self.update_playing()
+            self.profiler.mark("update_playing")
         elif self.state == GameState.WORD_CHALLENGE:
             self.update_word_challenge()
+            self.profiler.mark("update_word_challenge")
+        
+        self.sim_steps += 1
     
     def update_playing(self):
         """Update main gameplay"""
-        keys = pygame.key.get_pressed()
+        keys = self.input.get_pressed()
         
         # Update player
         self.player.update(keys, self.dt)
@@ -287,7 +541,7 @@ class PlanetLatinGame:
         
         # Start word challenge if monster requests it
         if challenge_monster and self.current_challenge is None:
-            self.current_challenge = WordChallenge(challenge_monster)
+            self.current_challenge = WordChallenge(challenge_monster, self.typing_time_limit)
             self.state = GameState.WORD_CHALLENGE
     
     def update_word_challenge(self):
@@ -314,16 +568,71 @@ class PlanetLatinGame:
                     self.challenge_complete_timer = 0
                     self.state = GameState.PLAYING
     
-    def draw(self):
+    def draw(self, alpha=1.0):
         """Draw everything"""
-        # Clear screen with background
-        self.screen.fill(Colors.BACKGROUND)
+        # Place moving objects between the last two simulation steps
+        self.player.interpolate(alpha)
+        self.monster_manager.interpolate(alpha)
+        self.monster_manager.update_detail(self.player)
+        
+        if self.background is None or self.background.get_size() != self.screen.get_size():
+            self._build_background()
+        # The sky behind an overlay is frozen in its snapshot
+        twinkled = (self.state not in [GameState.PAUSED, GameState.WORD_CHALLENGE]
+                    and self.quality.enabled("twinkle") and self._update_twinkle())
+        if self.profiler.enabled:
+            self.profiler.refresh(self)
+        self.profiler.mark("draw_prepare")
+        
+        if self.renderer is None:
+            self._draw_scene()
+            self.display.flip()
+            self.profiler.mark("display_flip")
+            return
         
-        # Draw stars
-        for star in self.background_stars:
-            x, y, brightness, size = star
-            star_color = (brightness, brightness, brightness)
-            pygame.draw.circle(self.screen, star_color, (x, y), size)
+        if twinkled:
+            for rect in self.star_rects:
+                self.renderer.mark_dirty(rect)
+        self._collect_dirty_regions()
+        self.profiler.mark("draw_collect")
+        self.renderer.render(self._draw_scene)
+        self.profiler.mark("display_flip")
+    
+    def _collect_dirty_regions(self):
+        """Report every object that can change on the current screen to the renderer"""
+        renderer = self.renderer
+        if self.state in [GameState.MENU, GameState.BOOK_SELECTION, GameState.LESSON_SELECTION]:
+            for component in self.menu_manager.components:
+                renderer.track(("ui", id(component)), *component.get_render_state())
+        
+        if self.state == GameState.PLAYING:
+            for monster in self.monster_manager.monsters:
+                renderer.track(("monster", id(monster)), *monster.get_render_state())
+            renderer.track("player", *self.player.get_render_state())
+            renderer.track("stats", *self.player.get_stats_render_state())
+            if self.player.level_up_effect > 0:
+                renderer.track("level_up", pygame.Rect(GameConfig.SCREEN_WIDTH // 2 - 100, 80, 200, 40))
+            renderer.track("counter", pygame.Rect(GameConfig.SCREEN_WIDTH - 150, 10, 150, 40),
+                           (len(self.monster_manager.get_active_monsters()), self.monster_manager.level))
+        
+        if self.state == GameState.WORD_CHALLENGE and self.current_challenge:
+            challenge = self.current_challenge
+            panel = pygame.Rect(0, 0, 500, 300)
+            panel.center = (GameConfig.SCREEN_WIDTH // 2, GameConfig.SCREEN_HEIGHT // 2)
+            renderer.track("challenge", panel,
+                           (challenge.user_input, f"{challenge.time_left:.1f}", challenge.result,
+                            challenge.feedback_message, challenge.show_hint, int(time.time() * 2) % 2))
+        
+        if self.profiler.enabled:
+            renderer.track("profiler", *self.profiler.get_render_state())
+    
+    def _draw_scene(self):
+        """Draw the current screen; the renderer decides what reaches the display"""
+        # Clear screen with the pre-rendered sky and stars; overlay
+        # screens cover it with their own snapshot instead
+        if self.state not in [GameState.PAUSED, GameState.WORD_CHALLENGE]:
+            self.screen.blit(self.background, (0, 0))
+        self.profiler.mark("draw_background")
         
         if self.state == GameState.MENU:
             self.draw_menu()
@@ -338,83 +647,27 @@ class PlanetLatinGame:
         elif self.state == GameState.WORD_CHALLENGE:
             self.draw_word_challenge()
         elif self.state == GameState.PAUSED:
-            self.draw_playing()  # Draw game underneath
             self.draw_pause_overlay()
         elif self.state == GameState.GAME_OVER:
             self.draw_game_over()
+        self.profiler.mark(f"draw_{self.state}")
         
-        pygame.display.flip()
+        if self.profiler.enabled:
+            self.profiler.draw(self.screen)
+            self.profiler.mark("draw_profiler")
     
     def draw_book_selection(self):
         """Draw book selection screen"""
-        # Title
-        title_text = self.font_large.render("SELECT TEXTBOOK", True, Colors.TEXT_WHITE)
-        title_rect = title_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 80))
-        self.screen.blit(title_text, title_rect)
-        
-        # Subtitle
-        subtitle_text = self.font_medium.render("Choose your Latin textbook", True, Colors.LIGHT_GRAY)
-        subtitle_rect = subtitle_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 120))
-        self.screen.blit(subtitle_text, subtitle_rect)
-        
-        # Draw UI components
         self.menu_manager.draw(self.screen)
     
     def draw_lesson_selection(self):
         """Draw lesson selection screen"""
-        # Title
-        if self.selected_textbook:
-            textbook = self.textbook_manager.get_textbook(self.selected_textbook)
-            title_text = self.font_large.render(textbook.name.upper(), True, Colors.TEXT_WHITE)
-        else:
-            title_text = self.font_large.render("SELECT LESSON", True, Colors.TEXT_WHITE)
-        title_rect = title_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 80))
-        self.screen.blit(title_text, title_rect)
-        
-        # Subtitle
-        subtitle_text = self.font_medium.render("Choose your lesson", True, Colors.LIGHT_GRAY)
-        subtitle_rect = subtitle_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 120))
-        self.screen.blit(subtitle_text, subtitle_rect)
-        
-        # Draw UI components
+        # Titles are labels in the menu, so this needs no textbook lookup
         self.menu_manager.draw(self.screen)
     
     def draw_menu(self):
         """Draw main menu"""
-        # Title
-        title_text = self.font_large.render("PLANET LATIN", True, Colors.TEXT_WHITE)
-        title_rect = title_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 150))
-        
-        # Add glow effect to title
-        for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
-            glow_rect = title_rect.copy()
-            glow_rect.x += offset[0]
-            glow_rect.y += offset[1]
-            glow_text = self.font_large.render("PLANET LATIN", True, Colors.GOLD)
-            self.screen.blit(glow_text, glow_rect)
-        
-        self.screen.blit(title_text, title_rect)
-        
-        # Subtitle
-        subtitle_text = self.font_medium.render("Educational Latin Adventure", True, Colors.TEXT_WHITE)
-        subtitle_rect = subtitle_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 200))
-        self.screen.blit(subtitle_text, subtitle_rect)
-        
-        # Draw menu buttons
         self.menu_manager.draw(self.screen)
-        
-        # Game description
-        description = [
-            "Choose your textbook and lesson to start learning!",
-            "Defeat monsters by translating English to Latin",
-            "Perfect companion for Latin students"
-        ]
-        
-        desc_y = 500
-        for i, line in enumerate(description):
-            desc_text = self.font_small.render(line, True, Colors.LIGHT_GRAY)
-            desc_rect = desc_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, desc_y + i * 25))
-            self.screen.blit(desc_text, desc_rect)
     
     def draw_instructions(self):
         """Draw instructions screen"""
@@ -466,55 +719,75 @@ class PlanetLatinGame:
             self.screen.blit(inst_text, (50, y_pos))
             y_pos += 25
     
-    def draw_playing(self):
+    def draw_playing(self, surface=None):
         """Draw main gameplay"""
+        surface = surface or self.screen
+        
         # Draw ground
         ground_y = GameConfig.SCREEN_HEIGHT - 100
-        pygame.draw.rect(self.screen, Colors.GROUND, 
+        pygame.draw.rect(surface, Colors.GROUND, 
                         (0, ground_y, GameConfig.SCREEN_WIDTH, 100))
-        pygame.draw.rect(self.screen, Colors.GRASS, 
+        pygame.draw.rect(surface, Colors.GRASS, 
                         (0, ground_y, GameConfig.SCREEN_WIDTH, 20))
         
         # Draw game objects
-        self.monster_manager.draw(self.screen)
-        self.player.draw(self.screen)
+        self.monster_manager.draw(surface)
+        self.profiler.mark("draw_monsters")
+        self.player.draw(surface)
+        self.profiler.mark("draw_player")
         
         # Draw UI
-        self.player.draw_stats(self.screen)
+        self.player.draw_stats(surface)
         
         # Draw monster counter
         active_monsters = len(self.monster_manager.get_active_monsters())
         monster_text = self.font_small.render(f"Monsters: {active_monsters}", True, Colors.TEXT_WHITE)
-        self.screen.blit(monster_text, (GameConfig.SCREEN_WIDTH - 150, 10))
+        surface.blit(monster_text, (GameConfig.SCREEN_WIDTH - 150, 10))
         
         # Draw level indicator
         level_text = self.font_small.render(f"Monster Level: {self.monster_manager.level}", True, Colors.TEXT_WHITE)
-        self.screen.blit(level_text, (GameConfig.SCREEN_WIDTH - 150, 30))
+        surface.blit(level_text, (GameConfig.SCREEN_WIDTH - 150, 30))
+        self.profiler.mark("draw_hud")
     
-    def draw_word_challenge(self):
-        """Draw word challenge interface"""
-        # Draw game underneath (dimmed)
-        self.draw_playing()
-        
-        # Dim overlay
-        overlay = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(Colors.BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
-        if not self.current_challenge:
-            return
-        
-        # Challenge panel
+    def _build_overlay(self):
+        """Snapshot the dimmed game scene with the static parts of the current overlay screen"""
+        # Freeze objects at their latest simulated positions
+        self.player.interpolate(1.0)
+        self.monster_manager.interpolate(1.0)
+        
+        overlay = pygame.Surface(self.screen.get_size()).convert()
+        overlay.blit(self.background, (0, 0))
+        self.draw_playing(overlay)
+        
+        # Dim the game underneath
+        dim = pygame.Surface(overlay.get_size())
+        dim.set_alpha(128)
+        dim.fill(Colors.BLACK)
+        overlay.blit(dim, (0, 0))
+        
+        if self.state == GameState.PAUSED:
+            self._draw_pause_text(overlay)
+        elif self.state == GameState.WORD_CHALLENGE and self.current_challenge:
+            self._draw_challenge_panel(overlay)
+        return overlay
+    
+    def _get_overlay(self):
+        """Get the cached backdrop of the current overlay screen"""
+        if self.overlay is None:
+            self.overlay = self._build_overlay()
+        return self.overlay
+    
+    def _draw_challenge_panel(self, surface):
+        """Draw the parts of the challenge panel that stay fixed during a challenge"""
         panel_width = 500
         panel_height = 300
         panel_x = (GameConfig.SCREEN_WIDTH - panel_width) // 2
         panel_y = (GameConfig.SCREEN_HEIGHT - panel_height) // 2
         
         # Panel background
-        pygame.draw.rect(self.screen, Colors.UI_BACKGROUND, 
+        pygame.draw.rect(surface, Colors.UI_BACKGROUND, 
                         (panel_x, panel_y, panel_width, panel_height), border_radius=10)
-        pygame.draw.rect(self.screen, Colors.WHITE, 
+        pygame.draw.rect(surface, Colors.WHITE, 
                         (panel_x, panel_y, panel_width, panel_height), 3, border_radius=10)
         
         # Challenge content
@@ -523,14 +796,32 @@ class PlanetLatinGame:
         # Title
         title_text = self.font_large.render("WORD CHALLENGE", True, Colors.TEXT_WHITE)
         title_rect = title_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, y_offset + 20))
-        self.screen.blit(title_text, title_rect)
+        surface.blit(title_text, title_rect)
         y_offset += 60
         
         # English word
         word_text = self.font_large.render(f'"{self.current_challenge.english_word.upper()}"', True, Colors.GOLD)
         word_rect = word_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, y_offset + 20))
-        self.screen.blit(word_text, word_rect)
-        y_offset += 60
+        surface.blit(word_text, word_rect)
+    
+    def _create_challenge_lines(self):
+        """Create the challenge's input and timer lines, composed from glyph atlases"""
+        if self.input_line is None:
+            self.input_line = AtlasText(get_atlas(self.font_medium, Colors.INPUT_TEXT, Colors.INPUT_BOX_ACTIVE))
+            self.timer_lines = {color: AtlasText(get_atlas(self.font_medium, color, Colors.UI_BACKGROUND))
+                                for color in (Colors.TEXT_WHITE, Colors.TEXT_ERROR)}
+    
+    def draw_word_challenge(self):
+        """Draw word challenge interface"""
+        # Dimmed game, panel, title and word come from the snapshot
+        self.screen.blit(self._get_overlay(), (0, 0))
+        
+        if not self.current_challenge:
+            return
+        
+        # Dynamic content below the English word
+        panel_y = (GameConfig.SCREEN_HEIGHT - 300) // 2
+        y_offset = panel_y + 140
         
         # Instruction
         if self.current_challenge.result is None:
@@ -557,24 +848,26 @@ class PlanetLatinGame:
             pygame.draw.rect(self.screen, Colors.BLACK, 
                            (input_box_x, input_box_y, GameConfig.INPUT_BOX_WIDTH, GameConfig.INPUT_BOX_HEIGHT), 2)
             
-            # Input text
-            input_text = self.font_medium.render(self.current_challenge.user_input, True, Colors.INPUT_TEXT)
-            text_y = input_box_y + (GameConfig.INPUT_BOX_HEIGHT - input_text.get_height()) // 2
-            self.screen.blit(input_text, (input_box_x + 10, text_y))
+            # Input text (only visible on the active box colour)
+            self._create_challenge_lines()
+            self.input_line.set_text(self.current_challenge.user_input)
+            text_width, text_height = self.input_line.get_size()
+            text_y = input_box_y + (GameConfig.INPUT_BOX_HEIGHT - text_height) // 2
+            self.input_line.draw(self.screen, (input_box_x + 10, text_y))
             
             # Cursor
             if int(time.time() * 2) % 2:  # Blinking cursor
-                cursor_x = input_box_x + 10 + input_text.get_width()
+                cursor_x = input_box_x + 10 + text_width
                 pygame.draw.line(self.screen, Colors.INPUT_TEXT, 
-                               (cursor_x, text_y), (cursor_x, text_y + input_text.get_height()), 2)
+                               (cursor_x, text_y), (cursor_x, text_y + text_height), 2)
             
             y_offset += 60
             
             # Timer
             time_color = Colors.TEXT_ERROR if self.current_challenge.time_left < 5 else Colors.TEXT_WHITE
-            timer_text = self.font_medium.render(f"Time: {self.current_challenge.time_left:.1f}s", True, time_color)
-            timer_rect = timer_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, y_offset + 15))
-            self.screen.blit(timer_text, timer_rect)
+            timer_line = self.timer_lines[time_color]
+            timer_line.set_text(f"Time: {self.current_challenge.time_left:.1f}s")
+            timer_line.draw_centered(self.screen, (GameConfig.SCREEN_WIDTH // 2, y_offset + 15))
             
             # Hint
             if self.current_challenge.show_hint:
@@ -588,15 +881,15 @@ class PlanetLatinGame:
     
     def draw_pause_overlay(self):
         """Draw pause screen overlay"""
-        overlay = pygame.Surface((GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(Colors.BLACK)
-        self.screen.blit(overlay, (0, 0))
-        
+        # Everything on the pause screen is static
+        self.screen.blit(self._get_overlay(), (0, 0))
+    
+    def _draw_pause_text(self, surface):
+        """Draw the pause screen text"""
         # Pause text
         pause_text = self.font_large.render("PAUSED", True, Colors.TEXT_WHITE)
         pause_rect = pause_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, GameConfig.SCREEN_HEIGHT // 2 - 50))
-        self.screen.blit(pause_text, pause_rect)
+        surface.blit(pause_text, pause_rect)
         
         # Instructions
         instructions = [
@@ -607,7 +900,11 @@ class PlanetLatinGame:
         for i, instruction in enumerate(instructions):
             inst_text = self.font_medium.render(instruction, True, Colors.TEXT_WHITE)
             inst_rect = inst_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, GameConfig.SCREEN_HEIGHT // 2 + i * 30))
-            self.screen.blit(inst_text, inst_rect)
+            surface.blit(inst_text, inst_rect)
+        
+        # Session seed, for bug reports
+        seed_text = self.font_small.render(f"Seed: {self.seed}", True, Colors.LIGHT_GRAY)
+        surface.blit(seed_text, (10, GameConfig.SCREEN_HEIGHT - 25))
     
     def start_game(self):
         """Start a new game"""
@@ -617,13 +914,14 @@ class PlanetLatinGame:
     def start_lesson(self):
         """Start the selected lesson"""
         # Set up the textbook manager with selected book and lesson
-        self.textbook_manager.set_current_textbook(self.selected_textbook, self.selected_lesson)
+        self.get_textbook_manager().set_current_textbook(self.selected_textbook, self.selected_lesson)
         
         # Update the monster manager to use textbook vocabulary
-        self.monster_manager = MonsterManager()
+        self.monster_manager = self.create_monster_manager()
         self.monster_manager.set_textbook_mode(self.textbook_manager)
         
-        # Start the game
+        # Start the game, once everything the lesson draws is built
+        self.warmup.wait("fonts", "player", "challenge_text")
         self.player = Player(GameConfig.PLAYER_START_X, GameConfig.PLAYER_START_Y)
         self.current_challenge = None
         self.state = GameState.PLAYING
@@ -694,18 +992,198 @@ class PlanetLatinGame:
                 self.state = GameState.BOOK_SELECTION
                 self.setup_book_selection_menu()
     
+    def _get_idle_timeout(self):
+        """Milliseconds the loop may sleep waiting for input, or None to run at full rate"""
+        if not GameConfig.IDLE_MODE or self.headless or self.input.events_per_step:
+            return None
+        if self.state not in self.IDLE_STATES or self.warmup.has_steps():
+            return None
+        if time.perf_counter() - self.last_input_time < GameConfig.IDLE_GRACE_PERIOD:
+            return None
+        
+        # The twinkling sky is the only animation left; wake up for its next frame
+        if (self.star_pixels is not None and self.state != GameState.PAUSED
+                and self.quality.enabled("twinkle")):
+            since_twinkle = pygame.time.get_ticks() - self.last_twinkle
+            return max(0, int(1000 / GameConfig.STAR_TWINKLE_HZ - since_twinkle))
+        return int(GameConfig.IDLE_MAX_WAIT * 1000)
+    
+    def _wait_for_input(self, timeout):
+        """Block until an event arrives or the timeout (ms) passes, leaving events queued"""
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return
+        # Put it back in front of anything queued behind it for handle_events
+        for pending in [event] + pygame.event.get():
+            pygame.event.post(pending)
+    
+    def prewarm(self):
+        """Start building what the game screens need while the menu is up"""
+        # Text rendering stays on this thread: one step per frame (see run)
+        for size in GameConfig.FONT_PRELOAD_SIZES:
+            self.warmup.queue("fonts", font_registry.preload, (size,))
+        for build, args in get_player_warmup_steps(*GameConfig.PLAYER_SIZE):
+            self.warmup.queue("player", build, *args)
+        self.warmup.queue("challenge_text", self._create_challenge_lines)
+        
+        # Pure data loads on the thread pool
+        self.warmup.submit("textbooks", TextbookManager)
+        self.warmup.submit("dictionary", LatinDictionary, self.rng.stream("monsters"))
+    
+    def _on_first_frame(self):
+        """Note the time to the first frame, then start warming up the caches for later screens"""
+        self.first_frame_shown = True
+        now = time.perf_counter()
+        self.startup["first_frame_ms"] = (now - self.init_finished) * 1000
+        self.startup["first_frame_time"] = time.time()  # Wall clock, to compare with process start
+        self.prewarm()
+        
+        if self.startup_report_path:
+            # Time until every build is done, as if the lesson started right away
+            self.warmup.wait()
+            self.startup["warmup_ms"] = (time.perf_counter() - now) * 1000
+            with open(self.startup_report_path, "w", encoding="utf-8") as f:
+                json.dump(self.startup, f, indent=2)
+            print(self.get_startup_report())
+            print(f"Warm-up: {self.warmup.report()}")
+            self.running = False
+    
+    def get_startup_report(self):
+        """Describe the startup costs in one line"""
+        return (f"Startup: imports {self.startup['imports_ms']:.1f}ms, init {self.startup['init_ms']:.1f}ms, "
+                f"first frame {self.startup['first_frame_ms']:.1f}ms, "
+                f"assets ready {self.startup['warmup_ms']:.1f}ms later")
+    
+    def start_sampling(self):
+        """Start the sampling profiler on the game loop"""
+        if self.sampler is None:
+            self.sampler = StackSampler()
+        self.sampler.start()
+    
+    def stop_sampling(self, path=None):
+        """Stop the sampling profiler and write its samples to path, or to timestamped files"""
+        self.sampler.stop()
+        if path:
+            self.sampler.write(path)
+            paths = [path]
+        else:
+            paths = self.sampler.write_snapshot()
+        print(f"Sampled {self.sampler.report()}, written to {', '.join(paths)}")
+        self.sampler = None
+    
+    def start_allocation_tracking(self, path):
+        """Trace allocations, snapshotting them on every state change, for a report at path"""
+        self.allocations = AllocationTracker(path)
+        self.allocations.start()
+    
     def run(self):
         """Main game loop"""
+        step = 1.0 / GameConfig.SIMULATION_HZ
+        accumulator = 0.0
         while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            self.clock.tick(GameConfig.FPS)
-        
+            idle_timeout = self._get_idle_timeout()
+            if idle_timeout is not None:
+                # Nothing moves on this screen: sleep until input or the
+                # next animation frame, and don't simulate the time slept
+                self._wait_for_input(idle_timeout)
+                self.clock.tick()
+                accumulator = 0.0
+            else:
+                # Real time since the last frame, clamped so a stall doesn't
+                # turn into a burst of catch-up steps
+                frame_time = self.clock.tick(GameConfig.FPS) / 1000.0
+                accumulator += min(frame_time, GameConfig.MAX_FRAME_TIME)
+            frame_start = time.perf_counter()
+            self.profiler.begin_frame()
+            
+            if not self.input.events_per_step:
+                self.input.tick(self.sim_steps * step)
+                self.handle_events()
+                self.profiler.mark("handle_events")
+            
+            # Run the simulation at a fixed rate, independent of rendering
+            steps = 0
+            while self.running and accumulator >= step and steps < GameConfig.MAX_SIMULATION_STEPS:
+                if self.input.events_per_step:
+                    # Replayed input is applied on the exact step it was recorded
+                    self.input.tick(self.sim_steps * step)
+                    self.handle_events()
+                    self.profiler.mark("handle_events")
+                self.update(step)
+                accumulator -= step
+                steps += 1
+            
+            # Too far behind: drop the backlog rather than spiral
+            if accumulator >= step:
+                accumulator = 0.0
+            
+            self.draw(accumulator / step)
+            if not self.first_frame_shown:
+                self._on_first_frame()
+            else:
+                self.warmup.step()
+            
+            self.profiler.end_frame(self)
+            frame_ms = (time.perf_counter() - frame_start) * 1000
+            self.quality.record(frame_ms)
+            if self.frame_times is not None:
+                self.frame_times.append(frame_ms)
+        
+        if self.sampler is not None:
+            self.stop_sampling(self.profile_path)
+        if self.allocations is not None:
+            self.allocations.snapshot("exit")
+            print(f"Allocation report written to {self.allocations.write_report()}")
+            self.allocations.stop()
+        self.warmup.shutdown()
+        self.input.finish(self)
         pygame.quit()
         sys.exit()
 
 
 if __name__ == "__main__":
-    game = PlanetLatinGame()
+    parser = argparse.ArgumentParser(description="Planet Latin - Educational Adventure")
+    parser.add_argument("--seed", type=int, default=None, help="session seed for a reproducible run")
+    parser.add_argument("--record", metavar="PATH", help="record the session's input and frame times")
+    parser.add_argument("--replay", metavar="PATH", help="replay a recorded session")
+    parser.add_argument("--frame-times", metavar="PATH", help="write frame times of a replay to this JSON file")
+    parser.add_argument("--render-mode", choices=Display.MODES, default=GameConfig.RENDER_MODE,
+                        help="how frames reach the window: native, scaled (GPU) or software")
+    parser.add_argument("--window-size", metavar="WxH", default=None,
+                        help="window size for the software render mode, e.g. 1920x1080")
+    parser.add_argument("--fullscreen", action="store_true", help="fill the screen")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="sample the game loop's call stacks and write them here on exit "
+                             "(.json: speedscope, otherwise collapsed stacks)")
+    parser.add_argument("--trace-allocations", metavar="PATH",
+                        help="snapshot memory with tracemalloc on state changes and F6, "
+                             "and write a growth report here")
+    parser.add_argument("--startup-report", metavar="PATH",
+                        help="write the import, init and first frame times here as JSON "
+                             "and quit once the first frame is shown")
+    args = parser.parse_args()
+    window_size = GameConfig.WINDOW_SIZE
+    if args.window_size:
+        window_size = tuple(int(n) for n in args.window_size.lower().split("x"))
+    
+    input_source = None
+    seed = args.seed
+    if args.replay:
+        recording = load_recording(args.replay)
+        input_source = ReplayInput(recording, args.frame_times)
+        seed = recording["seed"]
+    elif args.record:
+        input_source = InputRecorder(PygameInput(), args.record)
+    
+    game = PlanetLatinGame(input_source=input_source, seed=seed, render_mode=args.render_mode,
+                           window_size=window_size, fullscreen=args.fullscreen or GameConfig.FULLSCREEN)
+    if args.record or args.replay:
+        game.frame_times = []
+    print(f"Planet Latin session seed: {game.seed}")
+    if args.profile:
+        game.profile_path = args.profile
+        game.start_sampling()
+    if args.trace_allocations:
+        game.start_allocation_tracking(args.trace_allocations)
+    game.startup_report_path = args.startup_report
     game.run()
@@ -1,19 +1,25 @@
 import pygame
 import random
 import math
+import time
+from collections import deque
 from config import GameConfig, Colors
 from latin_dictionary import LatinDictionary
+from fonts import get_font
+from quality import quality_governor
+
 
 class Monster:
-    def __init__(self, x, y, difficulty="easy"):
+    def __init__(self, x, y, difficulty="easy", rng=None, dictionary=None):
         self.x = x
         self.y = y
         self.width, self.height = GameConfig.MONSTER_SIZE
         self.difficulty = difficulty
         self.speed = GameConfig.MONSTER_SPEED
+        self.rng = rng or random  # Injectable for reproducible sessions
         
         # Word challenge - will be set by monster manager
-        self.dictionary = LatinDictionary()
+        self.dictionary = dictionary or LatinDictionary(self.rng)
         self.english_word = None
         self.latin_word = None
         self.difficulty = difficulty
@@ -35,7 +41,23 @@ class Monster:
         self.target_x = x
         self.target_y = y
         self.wander_timer = 0
-        self.wander_interval = random.uniform(2, 5)  # seconds
+        self.wander_interval = self.rng.uniform(2, 5)  # seconds
+        
+        # Level-of-detail scheduling (see MonsterManager)
+        self.pending_dt = 0  # Simulation time not yet applied to this monster
+        self.lerp_from_x = x
+        self.lerp_from_y = y
+        self.lerp_elapsed = 0
+        self.lerp_duration = 0
+        
+        # Render interpolation between simulation steps
+        self.prev_display_x = x
+        self.prev_display_y = y
+        self.render_x = x
+        self.render_y = y
+        
+        self._bubble_size = None  # (word, width, height) of the word bubble
+        self.show_bubble = True  # Off for distant monsters at low quality
         
         # Challenge state
         self.is_challenging = False
@@ -83,14 +105,14 @@ class Monster:
         
         # Set new wander target
         if self.wander_timer <= 0:
-            self.target_x = self.x + random.uniform(-100, 100)
-            self.target_y = self.y + random.uniform(-50, 50)
+            self.target_x = self.x + self.rng.uniform(-100, 100)
+            self.target_y = self.y + self.rng.uniform(-50, 50)
             
             # Keep within screen bounds
             self.target_x = max(50, min(GameConfig.SCREEN_WIDTH - 50, self.target_x))
             self.target_y = max(100, min(GameConfig.SCREEN_HEIGHT - 150, self.target_y))
             
-            self.wander_timer = random.uniform(3, 6)
+            self.wander_timer = self.rng.uniform(3, 6)
         
         # Move towards target
         dx = self.target_x - self.x
@@ -102,6 +124,63 @@ class Monster:
             self.x += (dx / distance) * self.speed * dt * 60
             self.y += (dy / distance) * self.speed * dt * 60
     
+    def distance_squared_to(self, player):
+        """Get the squared distance to the player"""
+        dx = player.x - self.x
+        dy = player.y - self.y
+        return dx*dx + dy*dy
+    
+    def begin_interpolation(self, duration, start):
+        """Start blending the drawn position from start towards the current position"""
+        self.lerp_from_x, self.lerp_from_y = start
+        self.lerp_elapsed = 0
+        self.lerp_duration = duration
+    
+    def advance_interpolation(self, dt):
+        """Advance the drawn position between scheduled updates"""
+        self.lerp_elapsed += dt
+    
+    def get_display_position(self):
+        """Get the interpolated position used for drawing"""
+        if self.lerp_elapsed >= self.lerp_duration:
+            return self.x, self.y
+        t = self.lerp_elapsed / self.lerp_duration
+        return (self.lerp_from_x + (self.x - self.lerp_from_x) * t,
+                self.lerp_from_y + (self.y - self.lerp_from_y) * t)
+    
+    def save_previous_position(self):
+        """Remember the drawn position before a simulation step"""
+        self.prev_display_x, self.prev_display_y = self.get_display_position()
+    
+    def interpolate(self, alpha):
+        """Blend between the last two simulation steps for drawing"""
+        display_x, display_y = self.get_display_position()
+        self.render_x = self.prev_display_x + (display_x - self.prev_display_x) * alpha
+        self.render_y = self.prev_display_y + (display_y - self.prev_display_y) * alpha
+    
+    def _get_draw_position(self):
+        """Get the top-left drawing position, including the bob"""
+        return int(self.render_x), int(self.render_y + self.bob_offset)
+    
+    def get_render_state(self):
+        """Get the screen area the monster covers and a signature of its look"""
+        draw_x, draw_y = self._get_draw_position()
+        alpha = max(0, 255 - int(self.death_animation * 255)) if self.is_defeated else 255
+        if self.is_defeated and not quality_governor.enabled("death_fade"):
+            alpha = 0  # Removed at once rather than faded
+        
+        # Body, fade surface and word bubble above it
+        bounds = pygame.Rect(draw_x - 10, draw_y - 20, self.width + 20, self.height + 42)
+        if self.english_word and self.show_bubble:
+            if self._bubble_size is None or self._bubble_size[0] != self.english_word:
+                text_width, text_height = get_font(24).size(self.english_word.upper())
+                self._bubble_size = (self.english_word, text_width + 16, text_height + 16)
+            bubble_width, bubble_height = self._bubble_size[1:]
+            bubble_x = draw_x + self.width // 2 - bubble_width // 2
+            bubble_y = draw_y - 30 - bubble_height
+            bounds.union_ip(pygame.Rect(bubble_x - 2, bubble_y - 2, bubble_width + 4, bubble_height + 4))
+        return bounds, (draw_x, draw_y, alpha, self.english_word, self.show_bubble)
+    
     def defeat(self):
         """Mark monster as defeated"""
         self.is_defeated = True
@@ -133,11 +212,12 @@ class Monster:
             return
         
         # Calculate position with bobbing
-        draw_x = int(self.x)
-        draw_y = int(self.y + self.bob_offset)
+        draw_x, draw_y = self._get_draw_position()
         
         # Death fade effect
         if self.is_defeated:
+            if not quality_governor.enabled("death_fade"):
+                return
             alpha = max(0, 255 - int(self.death_animation * 255))
             # Create surface with alpha for fading
             monster_surface = pygame.Surface((self.width + 20, self.height + 40), pygame.SRCALPHA)
@@ -150,7 +230,8 @@ class Monster:
         else:
             # Normal drawing
             self._draw_monster_body(screen, draw_x, draw_y, 255)
-            self._draw_word_bubble(screen, draw_x, draw_y - 20, 255)
+            if self.show_bubble:
+                self._draw_word_bubble(screen, draw_x, draw_y - 20, 255)
     
     def _draw_monster_body(self, surface, x, y, alpha):
         """Draw the monster body"""
@@ -204,7 +285,7 @@ class Monster:
         if not self.english_word:
             return
         
-        font = pygame.font.Font(None, 24)
+        font = get_font(24)
         text_color = (*Colors.TEXT_BLACK, alpha) if alpha < 255 else Colors.TEXT_BLACK
         
         # Create text surface
@@ -254,10 +335,14 @@ class Monster:
 
 
 class MonsterManager:
-    def __init__(self):
+    def __init__(self, rng=None, frame_budget_ms=GameConfig.AI_FRAME_BUDGET_MS, dictionary=None):
+        self.rng = rng or random  # Injectable for reproducible sessions
+        self._dictionary = dictionary  # Shared by all spawned monsters, built on first use if not given
         self.monsters = []
         self.spawn_timer = 0
-        self.spawn_interval = 8.0  # seconds between spawns
+        self.spawn_interval = GameConfig.MONSTER_SPAWN_INTERVAL  # seconds between spawns
+        self.spawn_acceleration = GameConfig.MONSTER_SPAWN_ACCELERATION
+        self.min_spawn_interval = GameConfig.MONSTER_MIN_SPAWN_INTERVAL
         self.max_monsters = GameConfig.MAX_MONSTERS
         self.level = 1
         self.monsters_defeated = 0
@@ -265,9 +350,24 @@ class MonsterManager:
         self.vocabulary_list = []
         self.used_words = set()
         
+        # Level-of-detail scheduler
+        self.near_distance = GameConfig.AI_NEAR_DISTANCE
+        self.far_update_interval = GameConfig.AI_FAR_UPDATE_INTERVAL
+        self.frame_budget_ms = frame_budget_ms  # None: no budget, fully deterministic
+        self.round_robin_index = 0
+        self.frame_stats = deque(maxlen=GameConfig.AI_STATS_HISTORY)
+        
+    @property
+    def dictionary(self):
+        """The word dictionary, built when the first monster needs it"""
+        if self._dictionary is None:
+            self._dictionary = LatinDictionary(self.rng)
+        return self._dictionary
+    
     def update(self, player, dt):
         """Update all monsters"""
         challenge_request = None
+        frame_start = time.perf_counter()
         
         # Update spawn timer
         self.spawn_timer -= dt
@@ -275,15 +375,39 @@ class MonsterManager:
             self.spawn_monster(player)
             self.spawn_timer = self.spawn_interval
         
-        # Update existing monsters
-        monsters_to_remove = []
+        # Split monsters by distance: nearby, challenging and dying monsters
+        # need every frame, distant ones can wander at a reduced rate
+        near_monsters = []
+        far_monsters = []
+        near_distance_sq = self.near_distance * self.near_distance
         for monster in self.monsters:
-            result = monster.update(player, dt)
-            
-            if result == "challenge":
+            monster.pending_dt += dt
+            if (monster.is_defeated or monster.is_challenging
+                    or monster.distance_squared_to(player) < near_distance_sq):
+                near_monsters.append(monster)
+            else:
+                monster.advance_interpolation(dt)
+                far_monsters.append(monster)
+        
+        for monster in near_monsters:
+            if self._update_monster(monster, player, 0) == "challenge":
                 challenge_request = monster
-            
-            # Remove fully faded monsters
+        
+        far_challenge, far_updated = self._update_far_monsters(far_monsters, player, frame_start)
+        if far_challenge and challenge_request is None:
+            challenge_request = far_challenge
+        
+        self.frame_stats.append({
+            "near_updated": len(near_monsters),
+            "far_updated": len(far_updated),
+            "far_deferred": len(far_monsters) - len(far_updated),
+            "time_ms": (time.perf_counter() - frame_start) * 1000,
+        })
+        
+        # Remove fully faded monsters
+        defeated_before = self.monsters_defeated
+        monsters_to_remove = []
+        for monster in self.monsters:
             if monster.is_defeated and monster.death_animation > 1:
                 monsters_to_remove.append(monster)
                 self.monsters_defeated += 1
@@ -292,13 +416,62 @@ class MonsterManager:
         for monster in monsters_to_remove:
             self.monsters.remove(monster)
         
-        # Level progression
-        if self.monsters_defeated > 0 and self.monsters_defeated % 10 == 0:
+        # Level progression: one level for every 10 defeats, counted once as the total crosses them
+        for _ in range(self.monsters_defeated // 10 - defeated_before // 10):
             self.level += 1
-            self.spawn_interval = max(3.0, self.spawn_interval * 0.9)  # Spawn faster
+            self.spawn_interval = max(self.min_spawn_interval,
+                                      self.spawn_interval * self.spawn_acceleration)  # Spawn faster
         
         return challenge_request
     
+    def _update_monster(self, monster, player, interpolation_time):
+        """Apply all pending simulation time to a single monster"""
+        elapsed = monster.pending_dt
+        monster.pending_dt = 0
+        start = monster.get_display_position()  # Where it's drawn before the update moves it
+        result = monster.update(player, elapsed)
+        monster.begin_interpolation(interpolation_time, start)
+        return result
+    
+    def _update_far_monsters(self, far_monsters, player, frame_start):
+        """Update distant monsters round-robin within the frame budget"""
+        challenge_request = None
+        updated = []
+        count = len(far_monsters)
+        if count == 0:
+            return challenge_request, updated
+        
+        budget = self.frame_budget_ms / 1000.0 if self.frame_budget_ms is not None else None
+        start = self.round_robin_index % count
+        for i in range(count):
+            monster = far_monsters[(start + i) % count]
+            if monster.pending_dt < self.far_update_interval:
+                continue
+            
+            # Always let at least one monster through so nobody starves
+            if budget is not None and updated and time.perf_counter() - frame_start >= budget:
+                self.round_robin_index = start + i
+                return challenge_request, updated
+            
+            if self._update_monster(monster, player, self.far_update_interval) == "challenge":
+                challenge_request = monster
+            updated.append(monster)
+        
+        self.round_robin_index = start + count
+        return challenge_request, updated
+    
+    def get_scheduler_stats(self):
+        """Get monster update metrics for the last frame and recent average"""
+        if not self.frame_stats:
+            return {"near_updated": 0, "far_updated": 0, "far_deferred": 0,
+                    "time_ms": 0.0, "avg_updated": 0.0, "avg_time_ms": 0.0}
+        
+        stats = dict(self.frame_stats[-1])
+        frames = len(self.frame_stats)
+        stats["avg_updated"] = sum(s["near_updated"] + s["far_updated"] for s in self.frame_stats) / frames
+        stats["avg_time_ms"] = sum(s["time_ms"] for s in self.frame_stats) / frames
+        return stats
+    
     def set_textbook_mode(self, textbook_manager):
         """Set the monster manager to use textbook vocabulary"""
         self.textbook_manager = textbook_manager
@@ -321,8 +494,7 @@ class MonsterManager:
             available_words = self.vocabulary_list
         
         # Select random word
-        import random
-        english_word, latin_word = random.choice(available_words)
+        english_word, latin_word = self.rng.choice(available_words)
         self.used_words.add(english_word)
         
         return english_word, latin_word
@@ -333,15 +505,15 @@ class MonsterManager:
         if self.level <= 3:
             difficulty = "easy"
         elif self.level <= 6:
-            difficulty = random.choice(["easy", "medium"])
+            difficulty = self.rng.choice(["easy", "medium"])
         else:
-            difficulty = random.choice(["easy", "medium", "hard"])
+            difficulty = self.rng.choice(["easy", "medium", "hard"])
         
         # Find spawn position away from player
         attempts = 0
         while attempts < 10:
-            x = random.randint(50, GameConfig.SCREEN_WIDTH - 50)
-            y = random.randint(100, GameConfig.SCREEN_HEIGHT - 150)
+            x = self.rng.randint(50, GameConfig.SCREEN_WIDTH - 50)
+            y = self.rng.randint(100, GameConfig.SCREEN_HEIGHT - 150)
             
             # Check distance from player
             dx = x - player.x
@@ -349,7 +521,9 @@ class MonsterManager:
             distance = math.sqrt(dx*dx + dy*dy)
             
             if distance > GameConfig.MONSTER_SPAWN_DISTANCE:
-                monster = Monster(x, y, difficulty)
+                # Each monster gets its own stream so update order can't change its behaviour
+                monster_rng = random.Random(self.rng.getrandbits(64))
+                monster = Monster(x, y, difficulty, monster_rng, self.dictionary)
                 
                 # Set word from textbook if available
                 if self.textbook_manager:
@@ -365,6 +539,24 @@ class MonsterManager:
             
             attempts += 1
     
+    def save_previous_positions(self):
+        """Remember monster positions before a simulation step"""
+        for monster in self.monsters:
+            monster.save_previous_position()
+    
+    def interpolate(self, alpha):
+        """Blend monster positions between simulation steps for drawing"""
+        for monster in self.monsters:
+            monster.interpolate(alpha)
+    
+    def update_detail(self, player):
+        """Decide which monsters show their word bubble this frame"""
+        show_all = quality_governor.enabled("distant_bubbles")
+        bubble_distance_sq = GameConfig.QUALITY_BUBBLE_DISTANCE * GameConfig.QUALITY_BUBBLE_DISTANCE
+        for monster in self.monsters:
+            monster.show_bubble = (show_all or monster.is_challenging
+                                   or monster.distance_squared_to(player) < bubble_distance_sq)
+    
     def get_active_monsters(self):
         """Get all active (non-defeated) monsters"""
         return [m for m in self.monsters if not m.is_defeated]
@@ -378,3 +570,5 @@ class MonsterManager:
         """Clear all monsters"""
         self.monsters.clear()
         self.spawn_timer = self.spawn_interval
+        self.round_robin_index = 0
+        self.frame_stats.clear()
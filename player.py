@@ -1,6 +1,171 @@
 import pygame
 import math
 from config import GameConfig, Colors
+from fonts import get_font
+from quality import quality_governor
+
+_level_up_layer = None
+
+
+def _get_level_up_layer():
+    """Get the glowing "LEVEL UP!" text, rendered once, and where it goes"""
+    global _level_up_layer
+    if _level_up_layer is None:
+        notification_font = get_font(36)
+        level_up_text = notification_font.render("LEVEL UP!", True, Colors.GOLD)
+        glow_text = notification_font.render("LEVEL UP!", True, Colors.YELLOW)
+        
+        # Room for the glow copies offset two pixels each way
+        layer = pygame.Surface((level_up_text.get_width() + 4, level_up_text.get_height() + 4), pygame.SRCALPHA)
+        for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
+            layer.blit(glow_text, (2 + offset[0], 2 + offset[1]))
+        layer.blit(level_up_text, (2, 2))
+        
+        text_rect = level_up_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 100))
+        _level_up_layer = (layer, text_rect.move(-2, -2))
+    return _level_up_layer
+
+
+class PlayerSprites:
+    """The player figure pre-rendered for every walk frame, facing and glow tint"""
+    
+    HEAD_RADIUS = 8
+    MARGIN_X = 12  # room for the swinging arms
+    MARGIN_TOP = 2
+    MARGIN_BOTTOM = 18  # room for the legs below the body
+    
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.frame_width = width + self.MARGIN_X * 2
+        self.frame_height = height + self.MARGIN_TOP + self.MARGIN_BOTTOM
+        self.frames = GameConfig.PLAYER_WALK_FRAMES
+        self.tints = self._get_tints()
+        
+        # One row per (tint, facing), one column per walk frame
+        self.sheet = pygame.Surface((self.frame_width * self.frames,
+                                     self.frame_height * len(self.tints) * 2), pygame.SRCALPHA)
+        self.sheet.fill((0, 0, 0, 0))
+        for tint, body_color in enumerate(self.tints):
+            for facing_right in (False, True):
+                row = tint * 2 + facing_right
+                for frame in range(self.frames):
+                    arm_swing, leg_swing = self.get_swing(frame)
+                    self._draw_humanoid(self.sheet,
+                                        frame * self.frame_width + self.MARGIN_X,
+                                        row * self.frame_height + self.MARGIN_TOP,
+                                        body_color, arm_swing, leg_swing, facing_right)
+        
+        # Level up rings at preset radii; alpha fades as the ring grows
+        self.rings = {}
+        for radius in range(GameConfig.PLAYER_RING_STEP, 81, GameConfig.PLAYER_RING_STEP):
+            alpha = int(100 * (2.0 - radius / 40))
+            ring = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(ring, (*Colors.GOLD, alpha), (radius, radius), radius, 3)
+            self.rings[radius] = ring
+        
+        if pygame.display.get_surface() is not None:
+            self.sheet = self.sheet.convert_alpha()
+            self.rings = {radius: ring.convert_alpha() for radius, ring in self.rings.items()}
+    
+    @staticmethod
+    def _get_tints():
+        """Body colours: plain, then golden and green glows by increasing strength"""
+        base = Colors.PLAYER_BODY
+        steps = GameConfig.PLAYER_GLOW_STEPS
+        tints = [base]
+        for step in range(1, steps + 1):
+            glow_intensity = int(200 * step / steps)
+            tints.append((min(255, base[0] + glow_intensity),
+                          min(255, base[1] + glow_intensity),
+                          min(255, base[2] + glow_intensity)))
+        for step in range(1, steps + 1):
+            glow_intensity = int(50 * step / steps)
+            tints.append((base[0], min(255, base[1] + glow_intensity), base[2]))
+        return tints
+    
+    @staticmethod
+    def get_swing(frame):
+        """Arm and leg swing of a walk frame; both follow one gait cycle"""
+        phase = math.sin(2 * math.pi * frame / GameConfig.PLAYER_WALK_FRAMES)
+        return phase * 3, phase * 5
+    
+    @staticmethod
+    def get_walk_bob(frame):
+        """Vertical bob of a walk frame"""
+        return math.sin(2 * math.pi * frame / GameConfig.PLAYER_WALK_FRAMES) * 2
+    
+    def _draw_humanoid(self, surface, draw_x, draw_y, body_color, arm_swing, leg_swing, facing_right):
+        """Draw the figure with primitives (used only while baking)"""
+        # Head
+        head_radius = self.HEAD_RADIUS
+        head_x = draw_x + self.width // 2
+        head_y = draw_y + head_radius
+        pygame.draw.circle(surface, body_color, (head_x, head_y), head_radius)
+        pygame.draw.circle(surface, Colors.PLAYER_OUTLINE, (head_x, head_y), head_radius, 2)
+        
+        # Body
+        body_rect = pygame.Rect(draw_x + 5, draw_y + head_radius * 2 - 5, 
+                               self.width - 10, self.height - head_radius * 2 - 5)
+        pygame.draw.rect(surface, body_color, body_rect)
+        pygame.draw.rect(surface, Colors.PLAYER_OUTLINE, body_rect, 2)
+        
+        # Arms
+        arm_y = draw_y + head_radius * 2 + 5
+        left_arm_x = draw_x + 2
+        right_arm_x = draw_x + self.width - 2
+        
+        pygame.draw.line(surface, body_color, 
+                        (left_arm_x, arm_y), 
+                        (left_arm_x - 8, arm_y + 15 + arm_swing), 3)
+        pygame.draw.line(surface, body_color, 
+                        (right_arm_x, arm_y), 
+                        (right_arm_x + 8, arm_y + 15 - arm_swing), 3)
+        
+        # Legs
+        leg_y = draw_y + self.height - 5
+        left_leg_x = draw_x + 8
+        right_leg_x = draw_x + self.width - 8
+        
+        pygame.draw.line(surface, body_color,
+                        (left_leg_x, leg_y),
+                        (left_leg_x - 3 + leg_swing, leg_y + 15), 4)
+        pygame.draw.line(surface, body_color,
+                        (right_leg_x, leg_y),
+                        (right_leg_x + 3 - leg_swing, leg_y + 15), 4)
+        
+        # Eyes
+        eye_size = 2
+        if facing_right:
+            eye_x = head_x + 2
+        else:
+            eye_x = head_x - 2
+        eye_y = head_y - 2
+        pygame.draw.circle(surface, Colors.BLACK, (eye_x, eye_y), eye_size)
+    
+    def draw_figure(self, screen, draw_x, draw_y, frame, facing_right, tint):
+        """Blit one pre-rendered figure with its body's top-left at (draw_x, draw_y)"""
+        row = tint * 2 + facing_right
+        area = (frame * self.frame_width, row * self.frame_height, self.frame_width, self.frame_height)
+        screen.blit(self.sheet, (draw_x - self.MARGIN_X, draw_y - self.MARGIN_TOP), area)
+    
+    def draw_ring(self, screen, center_x, center_y, radius):
+        """Blit the pre-rendered ring closest in size to the given radius"""
+        step = GameConfig.PLAYER_RING_STEP
+        radius = min(max(step, round(radius / step) * step), max(self.rings))
+        screen.blit(self.rings[radius], (center_x - radius, center_y - radius))
+
+
+_player_sprites = {}
+
+
+def get_player_sprites(width, height):
+    """Get the sprite sheet for a player size, baking it on first use"""
+    key = (width, height)
+    if key not in _player_sprites:
+        _player_sprites[key] = PlayerSprites(width, height)
+    return _player_sprites[key]
+
 
 class Player:
     def __init__(self, x, y):
@@ -9,6 +174,12 @@ class Player:
         self.width, self.height = GameConfig.PLAYER_SIZE
         self.speed = GameConfig.PLAYER_SPEED
         
+        # Render interpolation between simulation steps
+        self.prev_x = x
+        self.prev_y = y
+        self.render_x = x
+        self.render_y = y
+        
         # Animation
         self.animation_time = 0
         self.walking = False
@@ -17,7 +188,8 @@ class Player:
         # Stats
         self.level = 1
         self.experience = 0
-        self.experience_to_next = 100
+        self.experience_to_next = GameConfig.PLAYER_FIRST_LEVEL_XP
+        self.experience_growth = GameConfig.PLAYER_XP_GROWTH
         self.words_learned = 0
         self.accuracy = 100.0
         self.total_attempts = 0
@@ -27,6 +199,10 @@ class Player:
         self.level_up_effect = 0
         self.word_learned_effect = 0
         
+        # Stats panel, rendered again only when it changes
+        self.stats_panel = None
+        self.stats_dirty = True  # Set whenever a value shown in the panel changes
+        
     def update(self, keys, dt):
         """Update player state"""
         self.animation_time += dt
@@ -75,182 +251,170 @@ class Player:
         
         # Update accuracy
         self.accuracy = (self.correct_attempts / self.total_attempts) * 100
+        self.stats_dirty = True
     
     def level_up(self):
         """Level up the player"""
         self.level += 1
         self.experience -= self.experience_to_next
-        self.experience_to_next = int(self.experience_to_next * 1.2)  # Increase requirement
+        self.experience_to_next = int(self.experience_to_next * self.experience_growth)  # Increase requirement
         self.level_up_effect = 2.0  # Visual effect duration
+        self.stats_dirty = True
         
         # Increase speed slightly
         self.speed += 0.2
     
+    def save_previous_position(self):
+        """Remember the position before a simulation step"""
+        self.prev_x = self.x
+        self.prev_y = self.y
+    
+    def interpolate(self, alpha):
+        """Blend between the last two simulation steps for drawing"""
+        self.render_x = self.prev_x + (self.x - self.prev_x) * alpha
+        self.render_y = self.prev_y + (self.y - self.prev_y) * alpha
+    
     def get_rect(self):
         """Get collision rectangle"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
     
-    def draw(self, screen):
-        """Draw the player"""
-        # Calculate animation offset for walking
+    def _get_draw_position(self):
+        """Get the top-left drawing position, including the walk bob"""
         walk_offset = 0
-        if self.walking:
-            walk_offset = math.sin(self.animation_time * 8) * 2
-        
-        draw_x = int(self.x)
-        draw_y = int(self.y + walk_offset)
-        
-        # Player body color with effects
-        body_color = Colors.PLAYER_BODY
-        if self.level_up_effect > 0:
+        if self.walking and quality_governor.enabled("walk_animation"):
+            walk_offset = PlayerSprites.get_walk_bob(self._get_pose()[0])
+        return int(self.render_x), int(self.render_y + walk_offset)
+    
+    def get_render_state(self):
+        """Get the screen area the player covers and a signature of its look"""
+        draw_x, draw_y = self._get_draw_position()
+        bounds = pygame.Rect(draw_x - 12, draw_y - 2, self.width + 24, self.height + 20)
+        frame, tint, ring_radius = self._get_pose()
+        signature = (draw_x, draw_y, self.facing_right, frame, tint, ring_radius)
+        if ring_radius > 0:
+            # Expanding ring around the head
+            radius = ring_radius + GameConfig.PLAYER_RING_STEP
+            head_x = draw_x + self.width // 2
+            head_y = draw_y + 8
+            bounds.union_ip(pygame.Rect(head_x - radius, head_y - radius, radius * 2, radius * 2))
+        return bounds, signature
+    
+    def get_stats_render_state(self):
+        """Get the stats panel area and a signature of what it shows"""
+        bounds = pygame.Rect(10, 10, 250, 120)
+        signature = (self.level, self.experience, self.experience_to_next,
+                     self.words_learned, round(self.accuracy, 1))
+        return bounds, signature
+    
+    def _get_pose(self):
+        """Get the (walk frame, tint, ring radius) to draw the player with"""
+        frame = 0
+        if self.walking and quality_governor.enabled("walk_animation"):
+            phase = self.animation_time * 8 / (2 * math.pi)
+            frame = int(phase * GameConfig.PLAYER_WALK_FRAMES) % GameConfig.PLAYER_WALK_FRAMES
+        
+        # Glow tints are quantized to the steps baked into the sprite sheet
+        steps = GameConfig.PLAYER_GLOW_STEPS
+        tint = 0
+        ring_radius = 0
+        glow = quality_governor.enabled("glow")
+        if glow and self.level_up_effect > 0:
             # Golden glow for level up
-            glow_intensity = int(100 * self.level_up_effect)
-            body_color = (min(255, Colors.PLAYER_BODY[0] + glow_intensity),
-                         min(255, Colors.PLAYER_BODY[1] + glow_intensity), 
-                         min(255, Colors.PLAYER_BODY[2] + glow_intensity))
-        elif self.word_learned_effect > 0:
+            tint = min(steps, math.ceil(self.level_up_effect / 2.0 * steps))
+            ring_radius = int(40 * (2.0 - self.level_up_effect))
+        elif glow and self.word_learned_effect > 0:
             # Green glow for correct answer
-            glow_intensity = int(50 * self.word_learned_effect)
-            body_color = (Colors.PLAYER_BODY[0],
-                         min(255, Colors.PLAYER_BODY[1] + glow_intensity),
-                         Colors.PLAYER_BODY[2])
-        
-        # Draw player body (simple humanoid figure)
-        # Head
-        head_radius = 8
-        head_x = draw_x + self.width // 2
-        head_y = draw_y + head_radius
-        pygame.draw.circle(screen, body_color, (head_x, head_y), head_radius)
-        pygame.draw.circle(screen, Colors.PLAYER_OUTLINE, (head_x, head_y), head_radius, 2)
-        
-        # Body
-        body_rect = pygame.Rect(draw_x + 5, draw_y + head_radius * 2 - 5, 
-                               self.width - 10, self.height - head_radius * 2 - 5)
-        pygame.draw.rect(screen, body_color, body_rect)
-        pygame.draw.rect(screen, Colors.PLAYER_OUTLINE, body_rect, 2)
-        
-        # Arms
-        arm_y = draw_y + head_radius * 2 + 5
-        left_arm_x = draw_x + 2
-        right_arm_x = draw_x + self.width - 2
-        arm_swing = math.sin(self.animation_time * 6) * 3 if self.walking else 0
-        
-        pygame.draw.line(screen, body_color, 
-                        (left_arm_x, arm_y), 
-                        (left_arm_x - 8, arm_y + 15 + arm_swing), 3)
-        pygame.draw.line(screen, body_color, 
-                        (right_arm_x, arm_y), 
-                        (right_arm_x + 8, arm_y + 15 - arm_swing), 3)
-        
-        # Legs
-        leg_y = draw_y + self.height - 5
-        left_leg_x = draw_x + 8
-        right_leg_x = draw_x + self.width - 8
-        leg_swing = math.sin(self.animation_time * 8) * 5 if self.walking else 0
-        
-        pygame.draw.line(screen, body_color,
-                        (left_leg_x, leg_y),
-                        (left_leg_x - 3 + leg_swing, leg_y + 15), 4)
-        pygame.draw.line(screen, body_color,
-                        (right_leg_x, leg_y),
-                        (right_leg_x + 3 - leg_swing, leg_y + 15), 4)
-        
-        # Eyes
-        eye_size = 2
-        if self.facing_right:
-            eye_x = head_x + 2
-        else:
-            eye_x = head_x - 2
-        eye_y = head_y - 2
-        pygame.draw.circle(screen, Colors.BLACK, (eye_x, eye_y), eye_size)
+            tint = steps + min(steps, math.ceil(self.word_learned_effect * steps))
+        return frame, tint, ring_radius
+    
+    def draw(self, screen):
+        """Draw the player"""
+        draw_x, draw_y = self._get_draw_position()
+        frame, tint, ring_radius = self._get_pose()
+        sprites = get_player_sprites(self.width, self.height)
+        sprites.draw_figure(screen, draw_x, draw_y, frame, self.facing_right, tint)
         
         # Level up effect
-        if self.level_up_effect > 0:
-            effect_radius = int(40 * (2.0 - self.level_up_effect))
-            effect_alpha = int(100 * self.level_up_effect)
-            
-            # Create effect surface
-            effect_surface = pygame.Surface((effect_radius * 2, effect_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(effect_surface, (*Colors.GOLD, effect_alpha), 
-                             (effect_radius, effect_radius), effect_radius, 3)
-            
-            # Draw centered on player
-            effect_x = head_x - effect_radius
-            effect_y = head_y - effect_radius
-            screen.blit(effect_surface, (effect_x, effect_y))
+        if ring_radius > 0:
+            head_x = draw_x + self.width // 2
+            head_y = draw_y + PlayerSprites.HEAD_RADIUS
+            sprites.draw_ring(screen, head_x, head_y, ring_radius)
     
     def draw_stats(self, screen):
         """Draw player statistics"""
-        font_large = pygame.font.Font(None, 24)
-        font_small = pygame.font.Font(None, 18)
+        # The panel only changes when a question is answered
+        if self.stats_dirty:
+            self.stats_panel = self._render_stats_panel()
+            self.stats_dirty = False
+        screen.blit(self.stats_panel, (10, 10))
+        
+        # Level up notification
+        if self.level_up_effect > 0:
+            layer, rect = _get_level_up_layer()
+            screen.blit(layer, rect)
+    
+    def _render_stats_panel(self):
+        """Render the stats panel into its own surface"""
+        font_large = get_font(GameConfig.FONT_SIZE_MEDIUM)
+        font_small = get_font(GameConfig.FONT_SIZE_SMALL)
         
         # Stats panel background
-        panel_x = 10
-        panel_y = 10
         panel_width = 250
         panel_height = 120
         
         # Semi-transparent background
-        stats_surface = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
-        pygame.draw.rect(stats_surface, Colors.UI_BACKGROUND, (0, 0, panel_width, panel_height), border_radius=5)
-        screen.blit(stats_surface, (panel_x, panel_y))
+        panel = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+        pygame.draw.rect(panel, Colors.UI_BACKGROUND, (0, 0, panel_width, panel_height), border_radius=5)
         
         # Border
-        pygame.draw.rect(screen, Colors.WHITE, (panel_x, panel_y, panel_width, panel_height), 2, border_radius=5)
+        pygame.draw.rect(panel, Colors.WHITE, (0, 0, panel_width, panel_height), 2, border_radius=5)
         
         # Stats text
-        y_offset = panel_y + 10
+        y_offset = 10
         
         # Level
         level_text = font_large.render(f"Level: {self.level}", True, Colors.TEXT_WHITE)
-        screen.blit(level_text, (panel_x + 10, y_offset))
+        panel.blit(level_text, (10, y_offset))
         y_offset += 25
         
         # Experience bar
         exp_text = font_small.render(f"XP: {self.experience}/{self.experience_to_next}", True, Colors.TEXT_WHITE)
-        screen.blit(exp_text, (panel_x + 10, y_offset))
+        panel.blit(exp_text, (10, y_offset))
         
         # Experience bar
-        bar_x = panel_x + 10
+        bar_x = 10
         bar_y = y_offset + 18
         bar_width = panel_width - 20
         bar_height = 8
         
         # Background bar
-        pygame.draw.rect(screen, Colors.DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(panel, Colors.DARK_GRAY, (bar_x, bar_y, bar_width, bar_height))
         
         # Experience fill
         exp_ratio = self.experience / self.experience_to_next
         exp_width = int(bar_width * exp_ratio)
-        pygame.draw.rect(screen, Colors.EASY_LEVEL, (bar_x, bar_y, exp_width, bar_height))
+        pygame.draw.rect(panel, Colors.EASY_LEVEL, (bar_x, bar_y, exp_width, bar_height))
         
         # Border
-        pygame.draw.rect(screen, Colors.WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
+        pygame.draw.rect(panel, Colors.WHITE, (bar_x, bar_y, bar_width, bar_height), 1)
         
         y_offset += 30
         
         # Words learned
         words_text = font_small.render(f"Words Learned: {self.words_learned}", True, Colors.TEXT_WHITE)
-        screen.blit(words_text, (panel_x + 10, y_offset))
+        panel.blit(words_text, (10, y_offset))
         y_offset += 18
         
         # Accuracy
         accuracy_color = Colors.TEXT_SUCCESS if self.accuracy >= 80 else Colors.TEXT_WARNING if self.accuracy >= 60 else Colors.TEXT_ERROR
         accuracy_text = font_small.render(f"Accuracy: {self.accuracy:.1f}%", True, accuracy_color)
-        screen.blit(accuracy_text, (panel_x + 10, y_offset))
+        panel.blit(accuracy_text, (10, y_offset))
         
-        # Level up notification
-        if self.level_up_effect > 0:
-            notification_font = pygame.font.Font(None, 36)
-            level_up_text = notification_font.render("LEVEL UP!", True, Colors.GOLD)
-            text_rect = level_up_text.get_rect(center=(GameConfig.SCREEN_WIDTH // 2, 100))
-            
-            # Add glow effect
-            for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
-                glow_rect = text_rect.copy()
-                glow_rect.x += offset[0]
-                glow_rect.y += offset[1]
-                glow_text = notification_font.render("LEVEL UP!", True, Colors.YELLOW)
-                screen.blit(glow_text, glow_rect)
-            
-            screen.blit(level_up_text, text_rect)
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert_alpha()
+        return panel
+
+
+def get_player_warmup_steps(width, height):
+    """The builds behind the player's sprites and level up text, as (build, args)"""
+    return [(get_player_sprites, (width, height)), (_get_level_up_layer, ())]
@@ -0,0 +1,231 @@
+# Planet Latin - Frame profiler
+# Times the phases of every frame into a ring buffer and shows them in an
+# overlay (F3) with percentiles, a frame time graph and per-frame counts of
+# entities, text renders and surface allocations. F4 exports the buffer.
+import csv
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+
+import pygame
+from config import GameConfig, Colors
+from fonts import CountingFont, get_font
+from glyph_atlas import get_atlas
+from replay import frame_time_stats
+
+
+# The real class, kept for when the counting one is swapped in
+_PygameSurface = pygame.Surface
+
+
+class _CountingSurface(_PygameSurface):
+    """pygame.Surface stand-in that counts allocations and where they happen"""
+    
+    created = 0
+    sites = Counter()  # (file, line, function) -> surfaces created there
+    
+    def __init__(self, *args, **kwargs):
+        _CountingSurface.created += 1
+        caller = sys._getframe(1)
+        _CountingSurface.sites[(caller.f_code.co_filename, caller.f_lineno, caller.f_code.co_name)] += 1
+        super().__init__(*args, **kwargs)
+
+
+_surface_counting_users = 0
+
+
+def count_surfaces(enabled):
+    """Swap the counting Surface class in or out; it stays in while anyone still needs it"""
+    global _surface_counting_users
+    _surface_counting_users = max(0, _surface_counting_users + (1 if enabled else -1))
+    pygame.Surface = _CountingSurface if _surface_counting_users else _PygameSurface
+
+
+def get_surface_counts():
+    """Get the number of surfaces created while counting, and a copy of their call sites"""
+    return _CountingSurface.created, Counter(_CountingSurface.sites)
+
+
+class FrameProfiler:
+    """Per-frame phase timings and counters, kept for the last few hundred frames.
+    
+    Phases are laps: mark(name) charges the time since the previous mark to
+    that phase, so the game only needs one call at the end of each phase.
+    """
+    
+    def __init__(self, history=GameConfig.PROFILER_HISTORY):
+        self.enabled = False
+        self.frames = deque(maxlen=history)
+        self.frame_number = 0
+        self.current = None
+        self.last_mark = 0.0
+        self.frame_start = 0.0
+        self.text_renders_at_start = 0
+        self.surfaces_at_start = 0
+        
+        # Overlay panel, redrawn a few times a second
+        self.panel = None
+        self.panel_version = 0
+        self.last_panel_time = 0.0
+        self.rect = pygame.Rect(GameConfig.SCREEN_WIDTH - GameConfig.PROFILER_PANEL_SIZE[0] - 10,
+                                GameConfig.SCREEN_HEIGHT - GameConfig.PROFILER_PANEL_SIZE[1] - 10,
+                                *GameConfig.PROFILER_PANEL_SIZE)
+    
+    def toggle(self):
+        """Show or hide the overlay; frames are only collected while it's shown"""
+        self.enabled = not self.enabled
+        # Surfaces are counted by swapping in a subclass, so the cost is only paid while profiling
+        count_surfaces(self.enabled)
+        self.current = None
+        self.panel = None
+    
+    def begin_frame(self):
+        """Start timing a frame"""
+        if not self.enabled:
+            return
+        self.frame_start = self.last_mark = time.perf_counter()
+        self.current = {}
+        self.text_renders_at_start = CountingFont.renders
+        self.surfaces_at_start = _CountingSurface.created
+    
+    def mark(self, phase):
+        """Charge the time since the last mark to a phase"""
+        if self.current is None:
+            return
+        now = time.perf_counter()
+        self.current[phase] = self.current.get(phase, 0.0) + (now - self.last_mark) * 1000
+        self.last_mark = now
+    
+    def end_frame(self, game):
+        """Store the finished frame with the game's counters"""
+        if self.current is None:
+            return
+        self.frame_number += 1
+        self.frames.append({
+            "frame": self.frame_number,
+            "state": game.state,
+            "total_ms": (time.perf_counter() - self.frame_start) * 1000,
+            "phases": self.current,
+            "entities": len(game.monster_manager.monsters) + 1,
+            "text_renders": CountingFont.renders - self.text_renders_at_start,
+            "surfaces": _CountingSurface.created - self.surfaces_at_start,
+            "quality": game.quality.level,
+        })
+        self.current = None
+    
+    def get_summary(self):
+        """Get frame time percentiles and the average time of each phase"""
+        summary = frame_time_stats([frame["total_ms"] for frame in self.frames])
+        totals = {}
+        for frame in self.frames:
+            for phase, ms in frame["phases"].items():
+                totals[phase] = totals.get(phase, 0.0) + ms
+        count = max(1, len(self.frames))
+        summary["phases"] = {phase: ms / count for phase, ms in totals.items()}
+        return summary
+    
+    def get_phase_names(self):
+        """Get every phase seen in the buffer, in first-seen order"""
+        names = {}
+        for frame in self.frames:
+            names.update(dict.fromkeys(frame["phases"]))
+        return list(names)
+    
+    def export(self, path):
+        """Write the buffered frames to a .csv or .json file"""
+        if path.endswith(".csv"):
+            phases = self.get_phase_names()
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame", "state", "total_ms", "entities", "text_renders",
+                                 "surfaces", "quality"] + [f"{phase}_ms" for phase in phases])
+                for frame in self.frames:
+                    writer.writerow([frame["frame"], frame["state"], f"{frame['total_ms']:.3f}",
+                                     frame["entities"], frame["text_renders"], frame["surfaces"],
+                                     frame["quality"]]
+                                    + [f"{frame['phases'].get(phase, 0.0):.3f}" for phase in phases])
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"summary": self.get_summary(), "frames": list(self.frames)}, f, indent=1)
+    
+    def export_snapshot(self, directory=GameConfig.PROFILER_EXPORT_DIR):
+        """Export the buffer as both CSV and JSON under a timestamped name; returns the paths"""
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, time.strftime("frames-%Y%m%d-%H%M%S"))
+        paths = [stem + ".csv", stem + ".json"]
+        for path in paths:
+            self.export(path)
+        return paths
+    
+    def get_render_state(self):
+        """Get the overlay area and a signature of what it shows"""
+        return self.rect, self.panel_version
+    
+    def refresh(self, game):
+        """Redraw the overlay's contents if they are due, a few times a second"""
+        now = time.perf_counter()
+        if self.panel is None or now - self.last_panel_time >= 1 / GameConfig.PROFILER_REFRESH_HZ:
+            self.panel = self._render_panel(game)
+            self.panel_version += 1
+            self.last_panel_time = now
+    
+    def draw(self, screen):
+        """Draw the overlay"""
+        screen.blit(self.panel, self.rect)
+    
+    def _render_panel(self, game):
+        """Render the statistics and frame time graph into the panel"""
+        panel = _PygameSurface(self.rect.size).convert()
+        panel.fill(Colors.UI_BACKGROUND)
+        pygame.draw.rect(panel, Colors.GRAY, panel.get_rect(), 1)
+        font = get_font(16)
+        text = get_atlas(font, Colors.TEXT_WHITE, Colors.UI_BACKGROUND)
+        dim = get_atlas(font, Colors.LIGHT_GRAY, Colors.UI_BACKGROUND)
+        line_height = font.get_linesize()
+        
+        summary = self.get_summary()
+        last = self.frames[-1] if self.frames else None
+        quality = game.quality.get_stats()
+        lines = [
+            (text, f"Frame p50 {summary['p50']:.1f}  p95 {summary['p95']:.1f}  "
+                   f"p99 {summary['p99']:.1f}ms ({summary['frames']})"),
+            (text, f"Quality {quality['level']}/{quality['max_level']}  "
+                   + (f"({', '.join(quality['disabled'])} off)" if quality['disabled'] else "(full)")),
+        ]
+        if last:
+            lines.append((text, f"Entities {last['entities']}  Text renders {last['text_renders']}  "
+                                f"Surfaces {last['surfaces']}"))
+        y = 6
+        for atlas, line in lines:
+            atlas.draw(panel, line, (8, y))
+            y += line_height
+        
+        # Average time per phase, two columns
+        phases = list(summary["phases"].items())
+        column_width = (self.rect.width - 16) // 2
+        for i, (phase, ms) in enumerate(phases):
+            column, row = i % 2, i // 2
+            dim.draw(panel, f"{phase} {ms:.2f}", (8 + column * column_width, y + row * line_height))
+        y += (len(phases) + 1) // 2 * line_height + 6
+        
+        self._draw_graph(panel, pygame.Rect(8, y, self.rect.width - 16, self.rect.height - y - 8))
+        return panel
+    
+    def _draw_graph(self, panel, area):
+        """Plot recent frame times against the frame budget"""
+        if area.height <= 0:
+            return
+        pygame.draw.rect(panel, Colors.BLACK, area)
+        budget = GameConfig.QUALITY_FRAME_BUDGET_MS
+        scale = area.height / (budget * 2)  # The budget line sits halfway up
+        frames = list(self.frames)[-area.width:]
+        x = area.right - len(frames)
+        for frame in frames:
+            height = min(area.height, max(1, int(frame["total_ms"] * scale)))
+            color = Colors.TEXT_SUCCESS if frame["total_ms"] <= budget else Colors.TEXT_ERROR
+            pygame.draw.line(panel, color, (x, area.bottom - 1), (x, area.bottom - height))
+            x += 1
+        budget_y = area.bottom - int(budget * scale)
+        pygame.draw.line(panel, Colors.TEXT_WARNING, (area.left, budget_y), (area.right - 1, budget_y))
@@ -0,0 +1,88 @@
+# Planet Latin - Quality governor
+# Watches how long frames take and switches non-essential effects off while
+# the game runs over its frame budget, then back on once there's headroom.
+import time
+
+from config import GameConfig
+
+
+class QualityGovernor:
+    """Picks a quality level from a moving average of frame times.
+    
+    Level 0 draws everything; each level above it drops one more effect.
+    Lowering and restoring use separate thresholds and delays so the level
+    doesn't flip back and forth around the budget.
+    """
+    
+    # Effects in the order they are given up, least noticeable first
+    EFFECTS = ("twinkle", "distant_bubbles", "death_fade", "glow", "walk_animation")
+    
+    def __init__(self, budget_ms=GameConfig.QUALITY_FRAME_BUDGET_MS):
+        self.budget_ms = budget_ms
+        self.smoothing = GameConfig.QUALITY_SMOOTHING
+        self.adaptive = GameConfig.QUALITY_GOVERNOR
+        self.max_level = len(self.EFFECTS)
+        self.reset()
+    
+    def reset(self):
+        """Go back to full quality and forget past frame times"""
+        self.level = 0
+        self.disabled = set()
+        self.average_ms = None
+        self.pending = None  # (level wanted, when the average first called for it)
+        self.changes = 0
+    
+    def enabled(self, effect):
+        """Check whether an effect should be drawn at the current level"""
+        return effect not in self.disabled
+    
+    def set_level(self, level):
+        """Switch to a quality level"""
+        self.level = max(0, min(self.max_level, level))
+        self.disabled = set(self.EFFECTS[:self.level])
+        self.pending = None
+        self.changes += 1
+    
+    def record(self, frame_ms, now=None):
+        """Add the time a frame took and adjust the level if it's been off budget long enough"""
+        if self.average_ms is None:
+            self.average_ms = frame_ms
+        else:
+            self.average_ms += (frame_ms - self.average_ms) * self.smoothing
+        if not self.adaptive:
+            return
+        
+        if self.average_ms > self.budget_ms * GameConfig.QUALITY_LOWER_AT and self.level < self.max_level:
+            wanted, delay = self.level + 1, GameConfig.QUALITY_LOWER_DELAY
+        elif self.average_ms < self.budget_ms * GameConfig.QUALITY_RESTORE_AT and self.level > 0:
+            wanted, delay = self.level - 1, GameConfig.QUALITY_RESTORE_DELAY
+        else:
+            self.pending = None
+            return
+        
+        now = time.perf_counter() if now is None else now
+        if self.pending is None or self.pending[0] != wanted:
+            self.pending = (wanted, now)
+        elif now - self.pending[1] >= delay:
+            self.set_level(wanted)
+    
+    def get_stats(self):
+        """Get the current level and what it leaves out"""
+        return {
+            "level": self.level,
+            "max_level": self.max_level,
+            "disabled": [effect for effect in self.EFFECTS if effect in self.disabled],
+            "average_ms": self.average_ms or 0.0,
+            "budget_ms": self.budget_ms,
+            "changes": self.changes,
+        }
+    
+    def report(self):
+        """Describe the quality level in one line"""
+        stats = self.get_stats()
+        dropped = ", ".join(stats["disabled"]) or "nothing"
+        return (f"quality {stats['level']}/{stats['max_level']} ({dropped} off), "
+                f"avg {stats['average_ms']:.1f}ms of {stats['budget_ms']:.1f}ms")
+
+
+quality_governor = QualityGovernor()
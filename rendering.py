@@ -0,0 +1,241 @@
+# Planet Latin - Display and dirty rectangle renderer
+import math
+
+import numpy
+import pygame
+from config import GameConfig
+
+
+class Display:
+    """The game window.
+    
+    The game always draws on a surface of the logical screen size, so game
+    coordinates never change; the render mode decides how that frame gets
+    to a window of another size:
+    
+    native: the window is the logical size and is drawn on directly
+    scaled: pygame.SCALED, SDL stretches the frame on the GPU and maps the mouse
+    software: the frame is scaled into the window in software; a full frame
+        with one transform.scale, a partial update only in its dirty regions
+    
+    No mode draws below the logical size: the drawing code places everything
+    in logical pixels, so the internal resolution is always SCREEN_WIDTH x
+    SCREEN_HEIGHT and only the window it is shown in can differ.
+    """
+    
+    MODES = ("native", "scaled", "software")
+    
+    def __init__(self, mode=GameConfig.RENDER_MODE, window_size=GameConfig.WINDOW_SIZE,
+                 fullscreen=GameConfig.FULLSCREEN):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown render mode: {mode}")
+        self.mode = mode
+        logical_size = (GameConfig.SCREEN_WIDTH, GameConfig.SCREEN_HEIGHT)
+        flags = pygame.FULLSCREEN if fullscreen else 0
+        
+        if mode == "software":
+            if fullscreen:
+                window_size = (0, 0)  # The desktop resolution
+            else:
+                flags |= pygame.RESIZABLE
+            self.window = pygame.display.set_mode(window_size or logical_size, flags)
+            self.surface = pygame.Surface(logical_size).convert()
+        else:
+            if mode == "scaled":
+                flags |= pygame.SCALED
+            self.window = pygame.display.set_mode(logical_size, flags)
+            self.surface = self.window
+        self._update_scale()
+    
+    def _update_scale(self):
+        """Work out the window pixels per logical pixel"""
+        window_width, window_height = self.window.get_size()
+        logical_width, logical_height = self.surface.get_size()
+        self.scale_x = window_width / logical_width
+        self.scale_y = window_height / logical_height
+        # The logical column and row each window pixel shows; the same
+        # nearest-pixel mapping transform.scale uses, so partial and full
+        # updates agree pixel for pixel
+        self.source_columns = numpy.arange(window_width) * logical_width // window_width
+        self.source_rows = numpy.arange(window_height) * logical_height // window_height
+    
+    def handle_resize(self):
+        """Pick up the window's new size after a VIDEORESIZE"""
+        self.window = pygame.display.get_surface()
+        if self.mode != "software":
+            self.surface = self.window
+        self._update_scale()
+    
+    def to_logical(self, pos):
+        """Convert a window position to logical screen coordinates"""
+        return int(pos[0] / self.scale_x), int(pos[1] / self.scale_y)
+    
+    def map_event(self, event):
+        """Rewrite a mouse event's position into logical coordinates"""
+        if self.mode != "software":
+            return  # Already logical (SDL maps the mouse in scaled mode)
+        if event.type in (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            event.pos = self.to_logical(event.pos)
+            if event.type == pygame.MOUSEMOTION:
+                event.rel = self.to_logical(event.rel)
+    
+    def _to_window(self, rect):
+        """Get the window rect a logical rect is scaled onto"""
+        left = math.floor(rect.left * self.scale_x)
+        top = math.floor(rect.top * self.scale_y)
+        right = math.ceil(rect.right * self.scale_x)
+        bottom = math.ceil(rect.bottom * self.scale_y)
+        return pygame.Rect(left, top, right - left, bottom - top)
+    
+    def _scale_regions(self, rects):
+        """Scale only the given logical regions into the window; returns their window rects"""
+        window_rect = self.window.get_rect()
+        window_rects = [self._to_window(rect).clip(window_rect) for rect in rects]
+        source = pygame.surfarray.pixels3d(self.surface)
+        target = pygame.surfarray.pixels3d(self.window)
+        for rect in window_rects:
+            columns = self.source_columns[rect.left:rect.right]
+            rows = self.source_rows[rect.top:rect.bottom]
+            target[rect.left:rect.right, rect.top:rect.bottom] = source[numpy.ix_(columns, rows)]
+        del source, target  # Unlock the surfaces
+        return window_rects
+    
+    def update(self, rects=None):
+        """Present the frame, or just the given logical regions of it"""
+        if self.mode == "software":
+            if rects is None:
+                pygame.transform.scale(self.surface, self.window.get_size(), self.window)
+            else:
+                rects = self._scale_regions(rects)
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+    
+    def flip(self):
+        """Present the whole frame"""
+        self.update()
+
+
+def _area(rect):
+    """Pixels covered by a rect"""
+    return rect.width * rect.height
+
+
+def merge_dirty_rects(rects, max_groups):
+    """Join dirty rects into at most max_groups regions, keeping the area they cover small"""
+    groups = []
+    for rect in rects:
+        # Join the region it grows least, unless that adds pixels and a new region is still allowed
+        growth = [_area(group.union(rect)) - _area(group) - _area(rect) for group in groups]
+        best = growth.index(min(growth)) if groups else None
+        if best is not None and (growth[best] <= 0 or len(groups) >= max_groups):
+            groups[best].union_ip(rect)
+        else:
+            groups.append(pygame.Rect(rect))
+    
+    # Regions that grew into each other become one
+    merged = []
+    for group in groups:
+        overlapping = group.collidelistall(merged)
+        while overlapping:
+            for i in reversed(overlapping):
+                group.union_ip(merged.pop(i))
+            overlapping = group.collidelistall(merged)
+        merged.append(group)
+    return merged
+
+
+class DirtyRectRenderer:
+    """Redraws and presents only the screen regions that changed since the last frame"""
+    
+    def __init__(self, screen, full_redraw_fraction=GameConfig.DIRTY_FULL_REDRAW_FRACTION, display=None,
+                 max_clip_rects=GameConfig.DIRTY_MAX_CLIP_RECTS):
+        self.screen = screen
+        self.display = display or pygame.display  # Anything with flip() and update(rects)
+        self.full_redraw_fraction = full_redraw_fraction
+        self.max_clip_rects = max_clip_rects
+        self.dirty_rects = []
+        self.full_redraw = True
+        self.tracked = {}  # key -> (rect, signature) as last drawn
+        self.seen = set()  # keys reported this frame
+        self.stats = {"full": 0, "partial": 0, "skipped": 0}
+        self.last_mode = None
+    
+    def invalidate(self):
+        """Force the next frame to redraw the whole screen"""
+        self.full_redraw = True
+    
+    def mark_dirty(self, rect):
+        """Mark a screen region as needing a redraw"""
+        self.dirty_rects.append(pygame.Rect(rect))
+    
+    def track(self, key, rect, signature=None):
+        """Report where an object draws and what it looks like this frame.
+        
+        The object's old and new regions become dirty whenever its bounds or
+        signature differ from what was drawn last frame.
+        """
+        self.seen.add(key)
+        previous = self.tracked.get(key)
+        if previous is not None and previous[1] == signature and previous[0] == rect:
+            return
+        self.dirty_rects.append(pygame.Rect(rect))
+        if previous is not None:
+            self.dirty_rects.append(previous[0])
+        self.tracked[key] = (pygame.Rect(rect), signature)
+    
+    def _get_clip_regions(self, rects, screen_rect):
+        """Group the dirty rects into clip regions that take in every tracked object they touch"""
+        # A clip edge through a shape can rasterise it differently (a rounded
+        # rect's border loses its bottom row), so no region edge cuts an object
+        objects = [rect.clip(screen_rect) for rect, signature in self.tracked.values()]
+        regions = merge_dirty_rects(rects, self.max_clip_rects)
+        while True:
+            grown = merge_dirty_rects([region.unionall([objects[i] for i in region.collidelistall(objects)])
+                                       for region in regions], self.max_clip_rects)
+            if grown == regions:
+                return regions
+            regions = grown
+    
+    def render(self, draw_scene):
+        """Draw the scene clipped to the dirty regions and push them to the display"""
+        # Objects that weren't reported this frame leave a hole to repaint
+        for key in [key for key in self.tracked if key not in self.seen]:
+            self.dirty_rects.append(self.tracked.pop(key)[0])
+        self.seen.clear()
+        
+        screen_rect = self.screen.get_rect()
+        rects = [rect.clip(screen_rect) for rect in self.dirty_rects]
+        rects = [rect for rect in rects if rect.width and rect.height]
+        self.dirty_rects = []
+        
+        full_redraw = self.full_redraw
+        self.full_redraw = False
+        if not full_redraw:
+            if not rects:
+                self.stats["skipped"] += 1
+                self.last_mode = "skipped"
+                return False
+            
+            # One clipped draw pass per group of nearby dirty rects, so far
+            # apart changes don't repaint everything between them; past the
+            # threshold a plain full redraw is cheaper
+            rects = self._get_clip_regions(rects, screen_rect)
+            if sum(_area(rect) for rect in rects) > _area(screen_rect) * self.full_redraw_fraction:
+                full_redraw = True
+        
+        if full_redraw:
+            draw_scene()
+            self.display.flip()
+            self.stats["full"] += 1
+            self.last_mode = "full"
+        else:
+            for rect in rects:
+                self.screen.set_clip(rect)
+                draw_scene()
+            self.screen.set_clip(None)
+            self.display.update(rects)
+            self.stats["partial"] += 1
+            self.last_mode = "partial"
+        return True
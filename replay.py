@@ -0,0 +1,273 @@
+# Planet Latin - Input recording and deterministic replay
+# Records the event stream of a real session to a compact file and feeds it
+# back into the windowed or headless loop, so the same session can be
+# replayed after every change and its frame times compared.
+import os
+import argparse
+import gzip
+import json
+import statistics
+from collections import defaultdict
+
+import pygame
+from config import GameConfig
+from game_input import InputSource
+
+RECORDING_VERSION = 1
+
+
+def encode_event(step, event):
+    """Encode an input event as a compact list, or None if it doesn't affect the game"""
+    if event.type == pygame.KEYDOWN:
+        return [step, "kd", event.key, event.unicode]
+    if event.type == pygame.KEYUP:
+        return [step, "ku", event.key]
+    if event.type == pygame.MOUSEMOTION:
+        return [step, "mm", event.pos[0], event.pos[1]]
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        return [step, "md", event.pos[0], event.pos[1], event.button]
+    if event.type == pygame.MOUSEBUTTONUP:
+        return [step, "mu", event.pos[0], event.pos[1], event.button]
+    if event.type == pygame.QUIT:
+        return [step, "q"]
+    return None
+
+
+def decode_event(entry):
+    """Rebuild a pygame event from its compact form"""
+    kind = entry[1]
+    if kind == "kd":
+        return pygame.event.Event(pygame.KEYDOWN, key=entry[2], unicode=entry[3], mod=0, scancode=0)
+    if kind == "ku":
+        return pygame.event.Event(pygame.KEYUP, key=entry[2], unicode="", mod=0, scancode=0)
+    if kind == "mm":
+        return pygame.event.Event(pygame.MOUSEMOTION, pos=(entry[2], entry[3]), rel=(0, 0), buttons=(0, 0, 0))
+    if kind == "md":
+        return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(entry[2], entry[3]), button=entry[4])
+    if kind == "mu":
+        return pygame.event.Event(pygame.MOUSEBUTTONUP, pos=(entry[2], entry[3]), button=entry[4])
+    return pygame.event.Event(pygame.QUIT)
+
+
+def save_recording(path, recording):
+    """Write a recording as gzip-compressed JSON"""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(recording, f, separators=(",", ":"))
+
+
+def load_recording(path):
+    """Read a recording written by save_recording"""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        recording = json.load(f)
+    if recording.get("version") != RECORDING_VERSION:
+        raise ValueError(f"Unsupported recording version: {recording.get('version')}")
+    return recording
+
+
+class InputRecorder(InputSource):
+    """Wraps a live input source and records every event with its simulation step"""
+    
+    # Recording needs the step-exact AI schedule that replay will use
+    deterministic = True
+    events_per_step = False
+    
+    def __init__(self, source, path):
+        self.source = source
+        self.path = path
+        self.step = 0
+        self.events = []
+        # Held keys come from the recorded events so replay sees the same state
+        self.held_keys = defaultdict(bool)
+    
+    def tick(self, sim_time):
+        """Note the simulation step the next events will be applied before"""
+        self.step = round(sim_time * GameConfig.SIMULATION_HZ)
+        self.source.tick(sim_time)
+    
+    def get_events(self):
+        """Get live events, recording the ones that matter for the game"""
+        events = self.source.get_events()
+        for event in events:
+            entry = encode_event(self.step, event)
+            if entry is not None:
+                self.events.append(entry)
+            if event.type == pygame.KEYDOWN:
+                self.held_keys[event.key] = True
+            elif event.type == pygame.KEYUP:
+                self.held_keys[event.key] = False
+        return events
+    
+    def get_pressed(self):
+        """Get the held keys as reconstructed from the event stream"""
+        return self.held_keys
+    
+    def attach_display(self, display):
+        """Record mouse positions in game coordinates"""
+        self.source.attach_display(display)
+    
+    def finish(self, game):
+        """Save the recording when the game loop ends"""
+        save_recording(self.path, {
+            "version": RECORDING_VERSION,
+            "seed": game.seed,
+            "hz": GameConfig.SIMULATION_HZ,
+            "steps": game.sim_steps,
+            "events": self.events,
+            "frame_times": game.frame_times or [],
+        })
+
+
+class ReplayInput(InputSource):
+    """Feeds a recording back into the game, step for step"""
+    
+    deterministic = True
+    # Events must land on the exact step they were recorded at
+    events_per_step = True
+    
+    def __init__(self, recording, frame_times_path=None):
+        if recording["hz"] != GameConfig.SIMULATION_HZ:
+            raise ValueError(f"Recording was made at {recording['hz']} Hz, "
+                             f"simulation runs at {GameConfig.SIMULATION_HZ} Hz")
+        self.recording = recording
+        self.seed = recording["seed"]
+        self.total_steps = recording["steps"]
+        self.frame_times_path = frame_times_path
+        self.entries = recording["events"]
+        self.next_index = 0
+        self.step = 0
+        self.pending_events = []
+        self.held_keys = defaultdict(bool)
+    
+    def tick(self, sim_time):
+        """Release the recorded events for the coming step"""
+        self.step = round(sim_time * GameConfig.SIMULATION_HZ)
+        while self.next_index < len(self.entries) and self.entries[self.next_index][0] <= self.step:
+            event = decode_event(self.entries[self.next_index])
+            if event.type == pygame.KEYDOWN:
+                self.held_keys[event.key] = True
+            elif event.type == pygame.KEYUP:
+                self.held_keys[event.key] = False
+            self.pending_events.append(event)
+            self.next_index += 1
+        if self.step >= self.total_steps and self.is_finished():
+            self.pending_events.append(pygame.event.Event(pygame.QUIT))
+    
+    def is_finished(self):
+        """Check whether the whole recording has been played"""
+        return self.next_index >= len(self.entries)
+    
+    def get_events(self):
+        """Get the events for the current step"""
+        events = self.pending_events
+        self.pending_events = []
+        # Real window events still matter: let the user close the replay
+        if pygame.display.get_surface() is not None:
+            events.extend(e for e in pygame.event.get() if e.type == pygame.QUIT)
+        return events
+    
+    def get_pressed(self):
+        """Get the held keys at the current step"""
+        return self.held_keys
+    
+    def finish(self, game):
+        """Write the captured frame times, if requested"""
+        if self.frame_times_path and game.frame_times is not None:
+            save_frame_times(self.frame_times_path, game.frame_times)
+
+
+def save_frame_times(path, frame_times):
+    """Write frame times (milliseconds) as JSON"""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"frame_times": frame_times}, f)
+
+
+def load_frame_times(path):
+    """Read frame times from a recording or a frame time file"""
+    if path.endswith(".json"):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["frame_times"]
+    return load_recording(path)["frame_times"]
+
+
+def frame_time_stats(frame_times):
+    """Summarise a frame time distribution in milliseconds"""
+    if not frame_times:
+        return {"frames": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(frame_times)
+    
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+    
+    return {
+        "frames": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": percentile(50),
+        "p95": percentile(95),
+        "p99": percentile(99),
+        "max": ordered[-1],
+    }
+
+
+def replay_headless(recording):
+    """Replay a recording without a window and report simulation throughput"""
+    from headless import HeadlessSession
+    
+    session = HeadlessSession(ReplayInput(recording), seed=recording["seed"], skip_menus=False)
+    result = session.run(seconds=(recording["steps"] + 1) / GameConfig.SIMULATION_HZ)
+    return session, result
+
+
+def compare(baseline_path, current_path):
+    """Print frame time percentiles of two runs side by side"""
+    baseline = frame_time_stats(load_frame_times(baseline_path))
+    current = frame_time_stats(load_frame_times(current_path))
+    print(f"{'':8}{'baseline':>12}{'current':>12}{'change':>10}")
+    for key in ("frames", "mean", "p50", "p95", "p99", "max"):
+        before, after = baseline[key], current[key]
+        change = f"{(after - before) / before:+.1%}" if before else ""
+        print(f"{key:8}{before:12.2f}{after:12.2f}{change:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded Planet Latin sessions")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    info = commands.add_parser("info", help="describe a recording")
+    info.add_argument("recording")
+    
+    play = commands.add_parser("play", help="replay a recording")
+    play.add_argument("recording")
+    play.add_argument("--headless", action="store_true", help="replay without a window")
+    play.add_argument("--frame-times", default=None, help="write captured frame times to this JSON file")
+    
+    diff = commands.add_parser("compare", help="compare frame times of two runs")
+    diff.add_argument("baseline", help="recording or frame time file")
+    diff.add_argument("current", help="recording or frame time file")
+    args = parser.parse_args()
+    
+    if args.command == "info":
+        recording = load_recording(args.recording)
+        print(f"Seed {recording['seed']}, {recording['steps']} steps "
+              f"({recording['steps'] / recording['hz']:.1f}s at {recording['hz']} Hz), "
+              f"{len(recording['events'])} events")
+        stats = frame_time_stats(recording["frame_times"])
+        print(f"Recorded frame times: p50 {stats['p50']:.2f}ms, p95 {stats['p95']:.2f}ms, "
+              f"p99 {stats['p99']:.2f}ms over {stats['frames']} frames")
+    elif args.command == "play" and args.headless:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        session, result = replay_headless(load_recording(args.recording))
+        print(f"Replayed {result['steps']} steps: level {result['level']}, "
+              f"{result['words_learned']} words, {result['steps_per_second']:.0f} steps/s")
+    elif args.command == "play":
+        from main import PlanetLatinGame
+        
+        recording = load_recording(args.recording)
+        game = PlanetLatinGame(input_source=ReplayInput(recording, args.frame_times), seed=recording["seed"])
+        game.frame_times = []
+        game.run()
+    else:
+        compare(args.baseline, args.current)
+
+
+if __name__ == "__main__":
+    main()
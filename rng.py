@@ -0,0 +1,21 @@
+# Planet Latin - Seeded random number streams
+import hashlib
+import random
+
+
+class SessionRNG:
+    """Derives an independent, reproducible random stream per subsystem from one session seed"""
+    
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.streams = {}
+    
+    def stream(self, name):
+        """Get the random stream for a subsystem, creating it on first use"""
+        if name not in self.streams:
+            # Hash rather than hash(): str hashing is salted per process
+            digest = hashlib.sha256(f"{self.seed}:{name}".encode("utf-8")).digest()
+            self.streams[name] = random.Random(int.from_bytes(digest[:8], "big"))
+        return self.streams[name]
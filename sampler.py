@@ -0,0 +1,129 @@
+# Planet Latin - Sampling profiler
+# A background thread looks at the game thread's call stack at a fixed
+# interval and counts what it sees. Nothing runs while it is stopped, and the
+# result can be written as collapsed stacks (flamegraph.pl, speedscope) or as
+# a speedscope JSON profile.
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from config import GameConfig
+
+
+class StackSampler:
+    """Statistical profiler for one thread, sampled from a daemon thread"""
+    
+    def __init__(self, interval=GameConfig.SAMPLER_INTERVAL, thread_id=None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.main_thread().ident
+        self.stacks = Counter()  # tuple of code objects, outermost first -> samples
+        self.samples = 0
+        self.started_at = None
+        self.duration = 0.0
+        self.stop_event = threading.Event()
+        self.thread = None
+    
+    def is_running(self):
+        """Check whether sampling is in progress"""
+        return self.thread is not None
+    
+    def start(self):
+        """Start sampling, adding to anything collected before"""
+        if self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.started_at = time.perf_counter()
+        self.thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self.thread.start()
+    
+    def stop(self):
+        """Stop sampling and wait for the sampler thread to finish"""
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        self.duration += time.perf_counter() - self.started_at
+    
+    def _run(self):
+        """Take a sample every interval until stopped"""
+        while not self.stop_event.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            stack.reverse()
+            self.stacks[tuple(stack)] += 1
+            self.samples += 1
+    
+    @staticmethod
+    def _frame_name(code):
+        """Name a stack frame by its function, file and first line"""
+        return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+    
+    def write(self, path):
+        """Write the samples: speedscope JSON for .json paths, collapsed stacks otherwise"""
+        if path.endswith(".json"):
+            self.write_speedscope(path)
+        else:
+            self.write_collapsed(path)
+    
+    def write_collapsed(self, path):
+        """Write one "outer;inner;leaf count" line per distinct stack"""
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(";".join(self._frame_name(code) for code in stack) + f" {count}\n")
+    
+    def write_speedscope(self, path):
+        """Write a sampled profile in speedscope's file format"""
+        frames = []
+        frame_index = {}
+        samples = []
+        weights = []
+        for stack, count in self.stacks.items():
+            indices = []
+            for code in stack:
+                if code not in frame_index:
+                    frame_index[code] = len(frames)
+                    frames.append({"name": code.co_name, "file": code.co_filename, "line": code.co_firstlineno})
+                indices.append(frame_index[code])
+            samples.append(indices)
+            weights.append(count * self.interval)
+        
+        profile = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": "Planet Latin main thread",
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+            "name": "Planet Latin",
+            "exporter": "planet-latin sampler",
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(profile, f)
+    
+    def write_snapshot(self, directory=GameConfig.PROFILER_EXPORT_DIR):
+        """Write both formats under a timestamped name; returns the paths"""
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, time.strftime("samples-%Y%m%d-%H%M%S"))
+        paths = [stem + ".folded", stem + ".speedscope.json"]
+        for path in paths:
+            self.write(path)
+        return paths
+    
+    def report(self):
+        """Describe the run in one line"""
+        return (f"{self.samples} samples over {self.duration:.1f}s "
+                f"({len(self.stacks)} distinct stacks, every {self.interval * 1000:.0f}ms)")
@@ -0,0 +1,201 @@
+# Planet Latin - Bot simulator for tuning spawn and XP curves
+# Runs many headless sessions in parallel and aggregates the results so
+# balance parameters can be swept instead of tuned by hand.
+import argparse
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from config import GameConfig
+
+# Parameters a sweep can vary, with their defaults
+TUNABLE_PARAMETERS = {
+    "spawn_interval": GameConfig.MONSTER_SPAWN_INTERVAL,
+    "spawn_acceleration": GameConfig.MONSTER_SPAWN_ACCELERATION,
+    "xp_growth": GameConfig.PLAYER_XP_GROWTH,
+    "time_limit": GameConfig.TYPING_TIME_LIMIT,
+    "accuracy": 0.8,
+    "chars_per_second": 4.0,
+}
+
+RESULT_FIELDS = [
+    ("config", np.int32),
+    ("session", np.int32),
+    ("spawn_interval", np.float64),
+    ("spawn_acceleration", np.float64),
+    ("xp_growth", np.float64),
+    ("time_limit", np.float64),
+    ("accuracy", np.float64),
+    ("chars_per_second", np.float64),
+    ("time_to_level", np.float64),  # NaN if the target level was never reached
+    ("final_level", np.int32),
+    ("attempts", np.int32),
+    ("failure_rate", np.float64),
+    ("max_backlog", np.int32),
+    ("mean_backlog", np.float64),
+    ("steps", np.int64),
+]
+
+
+def run_configuration(job):
+    """Run every session of one parameter configuration (executes in a worker)"""
+    # Imported here so the dummy video driver is set up inside each worker
+    from headless import BotPlayer, HeadlessSession
+    
+    config_index, params, sessions, seconds, target_level, seed = job
+    rows = []
+    for session_index in range(sessions):
+        session_seed = hash((seed, config_index, session_index)) & 0xFFFFFFFF
+        bot = BotPlayer(params["accuracy"], params["chars_per_second"])
+        session = HeadlessSession(bot, seed=session_seed)
+        apply_parameters(session, params)
+        
+        result = session.run(seconds, target_level)
+        time_to_level = result["level_times"].get(target_level, float("nan"))
+        rows.append((config_index, session_index,
+                     params["spawn_interval"], params["spawn_acceleration"],
+                     params["xp_growth"], params["time_limit"],
+                     params["accuracy"], params["chars_per_second"],
+                     time_to_level, result["level"], result["attempts"],
+                     result["failure_rate"], result["max_backlog"],
+                     result["mean_backlog"], result["steps"]))
+    return rows
+
+
+def apply_parameters(session, params):
+    """Override the balance parameters of a freshly started session"""
+    game = session.game
+    game.monster_manager.spawn_interval = params["spawn_interval"]
+    game.monster_manager.spawn_acceleration = params["spawn_acceleration"]
+    game.player.experience_growth = params["xp_growth"]
+    game.typing_time_limit = params["time_limit"]
+
+
+class SweepReport:
+    """NumPy-backed results of a parameter sweep, one row per session"""
+    
+    def __init__(self, rows, target_level):
+        self.results = np.array(rows, dtype=RESULT_FIELDS)
+        self.target_level = target_level
+    
+    def summarize(self):
+        """Aggregate sessions per configuration"""
+        configs = np.unique(self.results["config"])
+        summary = np.zeros(len(configs), dtype=[
+            ("config", np.int32),
+            *[(name, np.float64) for name in TUNABLE_PARAMETERS],
+            ("sessions", np.int32),
+            ("reached_level", np.float64),  # fraction of sessions reaching the target
+            ("median_time_to_level", np.float64),
+            ("p90_time_to_level", np.float64),
+            ("failure_rate", np.float64),
+            ("mean_backlog", np.float64),
+            ("max_backlog", np.float64),
+        ])
+        order = np.argsort(self.results["config"], kind="stable")
+        grouped = self.results[order]
+        starts = np.searchsorted(grouped["config"], configs)
+        for i, group in enumerate(np.split(grouped, starts[1:])):
+            times = group["time_to_level"]
+            reached = times[~np.isnan(times)]
+            summary[i]["config"] = configs[i]
+            for name in TUNABLE_PARAMETERS:
+                summary[i][name] = group[name][0]
+            summary[i]["sessions"] = len(group)
+            summary[i]["reached_level"] = len(reached) / len(group)
+            summary[i]["median_time_to_level"] = np.median(reached) if len(reached) else np.nan
+            summary[i]["p90_time_to_level"] = np.percentile(reached, 90) if len(reached) else np.nan
+            summary[i]["failure_rate"] = group["failure_rate"].mean()
+            summary[i]["mean_backlog"] = group["mean_backlog"].mean()
+            summary[i]["max_backlog"] = group["max_backlog"].max()
+        return summary
+    
+    def save_csv(self, path, summary=True):
+        """Write the per-configuration summary (or raw sessions) to CSV"""
+        data = self.summarize() if summary else self.results
+        fmt = ["%d" if np.issubdtype(data.dtype[name], np.integer) else "%.4f"
+               for name in data.dtype.names]
+        np.savetxt(path, data, delimiter=",", fmt=fmt,
+                   header=",".join(data.dtype.names), comments="")
+    
+    def print_summary(self, limit=10):
+        """Print the configurations that reach the target level fastest"""
+        summary = self.summarize()
+        order = np.lexsort((summary["median_time_to_level"], -summary["reached_level"]))
+        print(f"{len(self.results)} sessions over {len(summary)} configurations, "
+              f"target level {self.target_level}")
+        for row in summary[order][:limit]:
+            params = ", ".join(f"{name}={row[name]:g}" for name in TUNABLE_PARAMETERS)
+            median = row["median_time_to_level"]
+            median_text = "n/a" if np.isnan(median) else f"{median:.0f}s"
+            print(f"  [{row['config']}] {params}: "
+                  f"reached {row['reached_level']:.0%}, "
+                  f"median {median_text}, "
+                  f"failures {row['failure_rate']:.0%}, "
+                  f"backlog {row['mean_backlog']:.1f} (max {row['max_backlog']:.0f})")
+
+
+def build_grid(values):
+    """Expand per-parameter value lists into a list of configurations"""
+    names = list(TUNABLE_PARAMETERS)
+    grid = itertools.product(*(values.get(name) or [TUNABLE_PARAMETERS[name]] for name in names))
+    return [dict(zip(names, combination)) for combination in grid]
+
+
+def run_sweep(configurations, sessions=5, seconds=600.0, target_level=5, workers=None, seed=0):
+    """Run all configurations on a process pool and collect a report"""
+    jobs = [(i, params, sessions, seconds, target_level, seed)
+            for i, params in enumerate(configurations)]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (workers * 4))
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for config_rows in executor.map(run_configuration, jobs, chunksize=chunksize):
+            rows.extend(config_rows)
+    return SweepReport(rows, target_level)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep Planet Latin balance parameters with bot players")
+    parser.add_argument("--spawn-interval", type=float, nargs="+", help="initial seconds between spawns")
+    parser.add_argument("--spawn-acceleration", type=float, nargs="+", help="spawn interval multiplier per level")
+    parser.add_argument("--xp-growth", type=float, nargs="+", help="XP requirement multiplier per level")
+    parser.add_argument("--time-limit", type=float, nargs="+", help="seconds to type an answer")
+    parser.add_argument("--accuracy", type=float, nargs="+", help="bot answer accuracy")
+    parser.add_argument("--cps", type=float, nargs="+", help="bot typing speed in characters per second")
+    parser.add_argument("--sessions", type=int, default=5, help="sessions per configuration")
+    parser.add_argument("--seconds", type=float, default=600.0, help="game time per session")
+    parser.add_argument("--target-level", type=int, default=5, help="player level to time")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for the sweep")
+    parser.add_argument("--csv", default=None, help="write the per-configuration summary to this file")
+    parser.add_argument("--raw-csv", default=None, help="write every session to this file")
+    args = parser.parse_args()
+    
+    configurations = build_grid({
+        "spawn_interval": args.spawn_interval,
+        "spawn_acceleration": args.spawn_acceleration,
+        "xp_growth": args.xp_growth,
+        "time_limit": args.time_limit,
+        "accuracy": args.accuracy,
+        "chars_per_second": args.cps,
+    })
+    
+    start = time.perf_counter()
+    report = run_sweep(configurations, args.sessions, args.seconds,
+                       args.target_level, args.workers, args.seed)
+    elapsed = time.perf_counter() - start
+    
+    report.print_summary()
+    total_steps = int(report.results["steps"].sum())
+    print(f"Simulated {total_steps} steps in {elapsed:.1f}s ({total_steps / elapsed:.0f} steps/s)")
+    if args.csv:
+        report.save_csv(args.csv)
+    if args.raw_csv:
+        report.save_csv(args.raw_csv, summary=False)
+
+
+if __name__ == "__main__":
+    main()
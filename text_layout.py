@@ -0,0 +1,54 @@
+# Planet Latin - Text layout
+# Word-wrapping with cached word measurements: each distinct word is measured
+# once per font, and wrapping is a single pass over the words.
+
+
+class TextLayout:
+    """Measures and wraps text for one font"""
+    
+    def __init__(self, font):
+        self.font = font
+        self.word_widths = {}
+        self.space_width = font.size(" ")[0]
+    
+    def measure(self, word):
+        """Get the width of a word, measuring it only the first time"""
+        width = self.word_widths.get(word)
+        if width is None:
+            width = self.word_widths[word] = self.font.size(word)[0]
+        return width
+    
+    def wrap(self, text, max_width):
+        """Break text into lines no wider than max_width, keeping hard line breaks"""
+        lines = []
+        if not text:
+            return lines
+        for paragraph in text.split("\n"):
+            current_words = []
+            current_width = 0
+            for word in paragraph.split(" "):
+                word_width = self.measure(word)
+                if not current_words:
+                    current_words.append(word)
+                    current_width = word_width
+                elif current_width + self.space_width + word_width <= max_width:
+                    current_words.append(word)
+                    current_width += self.space_width + word_width
+                else:
+                    lines.append(" ".join(current_words))
+                    # A word wider than the line still gets a line of its own
+                    current_words = [word]
+                    current_width = word_width
+            lines.append(" ".join(current_words))
+        return lines
+
+
+_layouts = {}
+
+
+def get_layout(font):
+    """Get the shared layout engine for a font"""
+    layout = _layouts.get(font)
+    if layout is None:
+        layout = _layouts[font] = TextLayout(font)
+    return layout
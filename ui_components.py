@@ -1,6 +1,7 @@
 # UI Components for Planet Latin
 import pygame
 from config import Colors, GameConfig
+from text_layout import get_layout
 
 class Button:
     def __init__(self, x, y, width, height, text, font, color=Colors.UI_BACKGROUND, 
@@ -34,6 +35,10 @@ class Button:
                 return was_clicked
         return False
     
+    def get_render_state(self):
+        """Get the button area and a signature of its look"""
+        return self.rect, self.is_hovered
+    
     def draw(self, screen):
         """Draw the button"""
         # Choose color based on state
@@ -48,6 +53,8 @@ class Button:
 
 
 class ScrollableList:
+    """Virtualized list: only rows in view are rendered, and each only once"""
+    
     def __init__(self, x, y, width, height, items, font, item_height=40):
         self.rect = pygame.Rect(x, y, width, height)
         self.items = items
@@ -62,49 +69,98 @@ class ScrollableList:
         self.scrollbar_width = 20
         self.scrollbar_rect = pygame.Rect(x + width - self.scrollbar_width, y, 
                                         self.scrollbar_width, height)
-        self.scrollbar_handle_height = max(20, (self.max_visible_items / len(items)) * height)
         self.scrollbar_dragging = False
-        self.drag_start_y = 0
+        self.drag_grab_y = 0  # Where on the handle the drag started
+        
+        # Rendered text of the rows in and around the view; rows further
+        # away are dropped, so memory stays flat however long the list is
+        self.rows = {}  # item index -> text surface
+    
+    def set_items(self, items):
+        """Replace the list contents"""
+        self.items = items
+        self.selected_index = -1
+        self.hovered_index = -1
+        self.rows.clear()
+        self.scroll_to(self.scroll_offset)
+    
+    def get_max_scroll(self):
+        """Get the largest valid scroll offset"""
+        return max(0, len(self.items) - self.max_visible_items)
+    
+    def scroll_to(self, offset):
+        """Scroll so the given item is the first one visible"""
+        self.scroll_offset = max(0, min(self.get_max_scroll(), offset))
+    
+    def has_scrollbar(self):
+        """Check whether the items overflow the list"""
+        return len(self.items) > self.max_visible_items
+    
+    def get_item_area(self):
+        """Get the area the rows are drawn in, beside the scrollbar"""
+        return pygame.Rect(self.rect.x, self.rect.y, self.rect.width - self.scrollbar_width, self.rect.height)
+    
+    def get_handle_rect(self):
+        """Get the scrollbar handle's rect for the current scroll offset"""
+        track_height = self.scrollbar_rect.height
+        handle_height = track_height
+        if self.items:
+            handle_height = min(track_height, max(20, int(self.max_visible_items / len(self.items) * track_height)))
+        max_scroll = self.get_max_scroll()
+        handle_y = self.scrollbar_rect.y
+        if max_scroll:
+            handle_y += round(self.scroll_offset / max_scroll * (track_height - handle_height))
+        return pygame.Rect(self.scrollbar_rect.x, handle_y, self.scrollbar_width, handle_height)
+    
+    def _drag_to(self, mouse_y):
+        """Scroll so the grabbed point of the handle follows the mouse"""
+        handle = self.get_handle_rect()
+        travel = self.scrollbar_rect.height - handle.height
+        if travel > 0:
+            position = (mouse_y - self.drag_grab_y - self.scrollbar_rect.y) / travel
+            self.scroll_to(round(position * self.get_max_scroll()))
+    
+    def get_index_at(self, pos):
+        """Get the index of the item under a screen position, or -1"""
+        area = self.get_item_area() if self.has_scrollbar() else self.rect
+        if not area.collidepoint(pos):
+            return -1
+        item_index = (pos[1] - self.rect.y) // self.item_height + self.scroll_offset
+        return item_index if 0 <= item_index < len(self.items) else -1
     
     def handle_event(self, event):
         """Handle mouse events"""
         if event.type == pygame.MOUSEMOTION:
-            mouse_x, mouse_y = event.pos
-            if self.rect.collidepoint(event.pos):
-                # Calculate hovered item
-                relative_y = mouse_y - self.rect.y
-                item_index = (relative_y // self.item_height) + self.scroll_offset
-                self.hovered_index = item_index if 0 <= item_index < len(self.items) else -1
-            else:
-                self.hovered_index = -1
+            self.hovered_index = self.get_index_at(event.pos)
             
             # Handle scrollbar dragging
             if self.scrollbar_dragging:
-                delta_y = mouse_y - self.drag_start_y
-                self.scroll_offset = max(0, min(len(self.items) - self.max_visible_items,
-                                              int(delta_y / self.rect.height * len(self.items))))
+                self._drag_to(event.pos[1])
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                if self.scrollbar_rect.collidepoint(event.pos):
+                if self.has_scrollbar() and self.scrollbar_rect.collidepoint(event.pos):
+                    handle = self.get_handle_rect()
+                    # Clicking the track jumps the handle's middle to the mouse
+                    if handle.collidepoint(event.pos):
+                        self.drag_grab_y = event.pos[1] - handle.y
+                    else:
+                        self.drag_grab_y = handle.height // 2
+                        self._drag_to(event.pos[1])
                     self.scrollbar_dragging = True
-                    self.drag_start_y = event.pos[1]
-                elif self.rect.collidepoint(event.pos):
+                else:
                     # Select item
-                    mouse_x, mouse_y = event.pos
-                    relative_y = mouse_y - self.rect.y
-                    item_index = (relative_y // self.item_height) + self.scroll_offset
-                    if 0 <= item_index < len(self.items):
+                    item_index = self.get_index_at(event.pos)
+                    if item_index != -1:
                         self.selected_index = item_index
                         return item_index
             
             elif event.button == 4:  # Mouse wheel up
                 if self.rect.collidepoint(event.pos):
-                    self.scroll_offset = max(0, self.scroll_offset - 1)
+                    self.scroll_to(self.scroll_offset - 1)
             elif event.button == 5:  # Mouse wheel down
                 if self.rect.collidepoint(event.pos):
-                    self.scroll_offset = min(len(self.items) - self.max_visible_items, 
-                                           self.scroll_offset + 1)
+                    self.scroll_to(self.scroll_offset + 1)
         
         elif event.type == pygame.MOUSEBUTTONUP:
             if event.button == 1:
@@ -112,45 +168,67 @@ class ScrollableList:
         
         return -1
     
+    def get_render_state(self):
+        """Get the list area and a signature of its look"""
+        return self.rect, (self.scroll_offset, self.selected_index, self.hovered_index, len(self.items))
+    
+    def _get_row_text(self, index):
+        """Get the rendered text of an item, rendering it on first sight"""
+        text_surface = self.rows.get(index)
+        if text_surface is None:
+            item = self.items[index]
+            if isinstance(item, dict):
+                text = item.get('name', str(item))
+            else:
+                text = str(item)
+            text_surface = self.font.render(text, True, Colors.TEXT_BLACK)
+            if pygame.display.get_surface() is not None:
+                text_surface = text_surface.convert_alpha()
+            self.rows[index] = text_surface
+        return text_surface
+    
+    def _release_far_rows(self, first, last):
+        """Forget rows more than a page away from the view"""
+        low = first - self.max_visible_items
+        high = last + self.max_visible_items
+        if len(self.rows) > (high - low):
+            for index in [index for index in self.rows if not low <= index < high]:
+                del self.rows[index]
+    
     def draw(self, screen):
         """Draw the scrollable list"""
         # Draw background
         pygame.draw.rect(screen, Colors.UI_BACKGROUND, self.rect)
         pygame.draw.rect(screen, Colors.WHITE, self.rect, 2)
         
-        # Draw items
-        visible_items = self.items[self.scroll_offset:self.scroll_offset + self.max_visible_items]
-        for i, item in enumerate(visible_items):
-            item_y = self.rect.y + i * self.item_height
-            item_rect = pygame.Rect(self.rect.x, item_y, 
-                                  self.rect.width - self.scrollbar_width, self.item_height)
-            
-            actual_index = i + self.scroll_offset
+        # Only the visible slice is touched, however long the list is
+        first = self.scroll_offset
+        last = min(len(self.items), first + self.max_visible_items)
+        self._release_far_rows(first, last)
+        
+        item_width = self.rect.width - self.scrollbar_width
+        for index in range(first, last):
+            item_y = self.rect.y + (index - first) * self.item_height
+            item_rect = pygame.Rect(self.rect.x, item_y, item_width, self.item_height)
             
             # Highlight selected or hovered item
-            if actual_index == self.selected_index:
+            if index == self.selected_index:
                 pygame.draw.rect(screen, Colors.EASY_LEVEL, item_rect)
-            elif actual_index == self.hovered_index:
+            elif index == self.hovered_index:
                 pygame.draw.rect(screen, Colors.LIGHT_GRAY, item_rect)
             
             # Draw item text
-            if isinstance(item, dict):
-                text = item.get('name', str(item))
-            else:
-                text = str(item)
-            
-            text_surface = self.font.render(text, True, Colors.TEXT_BLACK)
-            text_rect = text_surface.get_rect(center=(item_rect.centerx, item_rect.centery))
-            screen.blit(text_surface, text_rect)
+            text_surface = self._get_row_text(index)
+            screen.blit(text_surface, text_surface.get_rect(center=item_rect.center))
             
             # Draw separator line
-            if i < len(visible_items) - 1:
+            if index < last - 1:
                 pygame.draw.line(screen, Colors.GRAY, 
                                (self.rect.x, item_y + self.item_height), 
                                (self.rect.right - self.scrollbar_width, item_y + self.item_height))
         
         # Draw scrollbar if needed
-        if len(self.items) > self.max_visible_items:
+        if self.has_scrollbar():
             self.draw_scrollbar(screen)
     
     def draw_scrollbar(self, screen):
@@ -159,9 +237,7 @@ class ScrollableList:
         pygame.draw.rect(screen, Colors.DARK_GRAY, self.scrollbar_rect)
         
         # Scrollbar handle
-        handle_y = self.scrollbar_rect.y + (self.scroll_offset / len(self.items)) * self.rect.height
-        handle_rect = pygame.Rect(self.scrollbar_rect.x, handle_y, 
-                                self.scrollbar_width, self.scrollbar_handle_height)
+        handle_rect = self.get_handle_rect()
         pygame.draw.rect(screen, Colors.LIGHT_GRAY, handle_rect)
         pygame.draw.rect(screen, Colors.WHITE, handle_rect, 1)
     
@@ -180,59 +256,115 @@ class TextDisplay:
         self.text_color = text_color
         self.background_color = background_color
         self.border_color = border_color
+        self.text = ""
         self.text_lines = []
         self.line_height = font.get_height() + 2
+        self.layout = get_layout(font)
+        self.wrap_width = None  # Width the text was last wrapped to
+        
+        # Rendered panel, reused until the text or size changes
+        self.surface = None
+        self.surface_size = None
     
     def set_text(self, text):
         """Set the text content, automatically wrapping lines"""
-        words = text.split(' ')
-        self.text_lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + (" " if current_line else "") + word
-            text_width = self.font.size(test_line)[0]
-            
-            if text_width <= self.rect.width - 20:  # 10px padding on each side
-                current_line = test_line
-            else:
-                if current_line:
-                    self.text_lines.append(current_line)
-                current_line = word
-        
-        if current_line:
-            self.text_lines.append(current_line)
+        if text == self.text and self.wrap_width == self.rect.width:
+            return
+        self.text = text
+        self.text_lines = self.layout.wrap(text, self.rect.width - 20)  # 10px padding on each side
+        self.wrap_width = self.rect.width
+        self.surface = None
     
-    def draw(self, screen):
-        """Draw the text display"""
+    def get_render_state(self):
+        """Get the text area and a signature of its look"""
+        return self.rect, tuple(self.text_lines)
+    
+    def _render(self):
+        """Render background, border and text into one surface"""
+        surface = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        
         # Draw background
         if self.background_color:
-            pygame.draw.rect(screen, self.background_color, self.rect)
+            surface.fill(self.background_color)
         
         # Draw border
         if self.border_color:
-            pygame.draw.rect(screen, self.border_color, self.rect, 2)
+            pygame.draw.rect(surface, self.border_color, surface.get_rect(), 2)
         
         # Draw text lines
-        y_offset = self.rect.y + 10  # Top padding
+        y_offset = 10  # Top padding
         for line in self.text_lines:
-            if y_offset + self.line_height > self.rect.bottom - 10:  # Bottom padding
+            if y_offset + self.line_height > self.rect.height - 10:  # Bottom padding
                 break
             
-            text_surface = self.font.render(line, True, self.text_color)
-            screen.blit(text_surface, (self.rect.x + 10, y_offset))  # Left padding
+            if line:
+                text_surface = self.font.render(line, True, self.text_color)
+                surface.blit(text_surface, (10, y_offset))  # Left padding
             y_offset += self.line_height
+        
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+    
+    def draw(self, screen):
+        """Draw the text display"""
+        if self.wrap_width is not None and self.wrap_width != self.rect.width:
+            # Wrapping depends on the width, so a resize lays the text out again
+            self.set_text(self.text)
+        if self.surface is None or self.surface_size != self.rect.size:
+            self.surface = self._render()
+            self.surface_size = self.rect.size
+        screen.blit(self.surface, self.rect)
+
+
+class Label:
+    """A static line of text, optionally with a glow around it"""
+    
+    def __init__(self, text, font, color, center, glow_color=None):
+        self.text = text
+        self.text_surface = font.render(text, True, color)
+        self.text_rect = self.text_surface.get_rect(center=center)
+        self.glow_surface = font.render(text, True, glow_color) if glow_color else None
+        
+        # The glow copies are offset two pixels each way
+        self.rect = self.text_rect.inflate(4, 4) if glow_color else self.text_rect.copy()
+    
+    def get_render_state(self):
+        """Get the label area and a signature of its look"""
+        return self.rect, self.text
+    
+    def draw(self, screen):
+        """Draw the label"""
+        if self.glow_surface:
+            for offset in [(2, 2), (-2, 2), (2, -2), (-2, -2)]:
+                screen.blit(self.glow_surface, self.text_rect.move(offset))
+        screen.blit(self.text_surface, self.text_rect)
 
 
 class MenuManager:
+    """Retained UI tree: components are composed into a cached surface and
+    only the ones whose look changed are redrawn"""
+    
     def __init__(self):
         self.components = []
         self.active = True
+        self.surface = None
+        self.drawn = {}  # id(component) -> (rect, signature) last composed
     
     def add_component(self, component):
         """Add a UI component to the manager"""
         self.components.append(component)
     
+    def activate(self):
+        """Reset transient mouse state when the screen is shown again"""
+        for component in self.components:
+            if isinstance(component, Button):
+                component.is_hovered = False
+                component.is_clicked = False
+            elif isinstance(component, ScrollableList):
+                component.hovered_index = -1
+                component.scrollbar_dragging = False
+    
     def handle_event(self, event):
         """Handle events for all components"""
         results = []
@@ -243,11 +375,44 @@ class MenuManager:
                     results.append((component, result))
         return results
     
+    def _compose(self, size):
+        """Redraw the components whose look changed into the menu surface"""
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+            if pygame.display.get_surface() is not None:
+                self.surface = self.surface.convert_alpha()
+            self.surface.fill((0, 0, 0, 0))
+            self.drawn = {}
+        
+        dirty = []
+        for component in self.components:
+            rect, signature = component.get_render_state()
+            previous = self.drawn.get(id(component))
+            if previous is None or previous[0] != rect or previous[1] != signature:
+                dirty.append(pygame.Rect(rect))
+                if previous is not None:
+                    dirty.append(previous[0])
+                self.drawn[id(component)] = (pygame.Rect(rect), signature)
+        if not dirty:
+            return
+        
+        # Clear the changed area and redraw everything that overlaps it
+        area = dirty[0].unionall(dirty[1:])
+        self.surface.set_clip(area)
+        self.surface.fill((0, 0, 0, 0), area)
+        for component in self.components:
+            if component.rect.colliderect(area):
+                component.draw(self.surface)
+        self.surface.set_clip(None)
+    
     def draw(self, screen):
         """Draw all components"""
-        for component in self.components:
-            component.draw(screen)
+        self._compose(screen.get_size())
+        if self.components:
+            bounds = self.components[0].rect.unionall([component.rect for component in self.components[1:]])
+            screen.blit(self.surface, bounds, bounds)
     
     def clear(self):
         """Clear all components"""
         self.components.clear()
+        self.surface = None
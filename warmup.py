@@ -0,0 +1,107 @@
+# Planet Latin - Asset warm-up
+# Builds what the game screens need while the main menu is already
+# interactive. Fonts, sprites and glyph atlases render text, which pygame
+# only does safely on the game thread, so they are queued as small steps run
+# one per frame. Pure data (textbooks, the word dictionary) loads on a small
+# thread pool. The game only waits for a build where it needs the result.
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from config import GameConfig
+
+
+class AssetWarmup:
+    """Asset builds spread over frames or run on a thread pool, awaited by name"""
+    
+    def __init__(self, workers=GameConfig.WARMUP_WORKERS):
+        self.workers = workers
+        self.executor = None  # Started with the first background build
+        self.futures = {}  # name -> Future of a build whose result hasn't been taken
+        self.steps = deque()  # (name, build, args) still to run on the game thread
+        self.build_times = {}  # name -> milliseconds the build took, on a worker or between frames
+        self.step_ms = 0.0  # Part of the build time spent in steps between frames
+        self.wait_times = {}  # name -> milliseconds the game thread waited for it
+    
+    def submit(self, name, build, *args):
+        """Start building an asset in the background; it must not touch fonts or surfaces"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="warmup")
+        self.futures[name] = self.executor.submit(self._run, name, build, *args)
+    
+    def queue(self, name, build, *args):
+        """Queue one step of a build that has to run on the game thread"""
+        self.steps.append((name, build, args))
+    
+    def has_steps(self):
+        """Whether queued steps are still waiting for a frame"""
+        return bool(self.steps)
+    
+    def step(self):
+        """Run the next queued step; called once per frame"""
+        if self.steps:
+            name, build, args = self.steps.popleft()
+            start = time.perf_counter()
+            self._run(name, build, *args)
+            self.step_ms += (time.perf_counter() - start) * 1000
+    
+    def _run(self, name, build, *args):
+        """Run one build, adding its time to the name's total"""
+        start = time.perf_counter()
+        try:
+            return build(*args)
+        finally:
+            self.build_times[name] = self.build_times.get(name, 0.0) + (time.perf_counter() - start) * 1000
+    
+    def result(self, name):
+        """Wait for a build and take its result; None if it was never started or already taken"""
+        steps = [queued for queued in self.steps if queued[0] == name]
+        future = self.futures.pop(name, None)
+        if not steps and future is None:
+            return None
+        start = time.perf_counter()
+        try:
+            # The game needs it now: run its remaining steps rather than wait for frames
+            for queued in steps:
+                self.steps.remove(queued)
+                self._run(name, queued[1], *queued[2])
+            return future.result() if future is not None else None  # A failed build raises here
+        finally:
+            self.wait_times[name] = (time.perf_counter() - start) * 1000
+    
+    def wait(self, *names):
+        """Finish builds whose results live in caches, so there is nothing to take"""
+        for name in names or self._get_names():
+            self.result(name)
+    
+    def _get_names(self):
+        """Names of the builds with queued steps or results not yet taken"""
+        return list(dict.fromkeys([queued[0] for queued in self.steps] + list(self.futures)))
+    
+    def shutdown(self):
+        """Drop builds that haven't started and wait for the running ones"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        self.futures.clear()
+        self.steps.clear()
+    
+    def get_stats(self):
+        """Get build and wait times of finished builds"""
+        return {
+            "builds": dict(self.build_times),
+            "build_ms": sum(self.build_times.values()),
+            "step_ms": self.step_ms,
+            "waits": dict(self.wait_times),
+            "wait_ms": sum(self.wait_times.values()),
+            "pending": [name for name in self._get_names()
+                        if name not in self.futures or not self.futures[name].done()],
+        }
+    
+    def report(self):
+        """Describe the warm-up in one line"""
+        stats = self.get_stats()
+        return (f"{len(stats['builds'])} assets built in {stats['build_ms']:.1f}ms "
+                f"({stats['step_ms']:.1f}ms of it between frames), "
+                f"game waited {stats['wait_ms']:.1f}ms"
+                + (f", still building {', '.join(stats['pending'])}" if stats["pending"] else ""))